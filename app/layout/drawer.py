@@ -3,6 +3,15 @@
 from nicegui import ui
 
 
+# (label, route, icon) for each navigation button
+_NAV_ITEMS = (
+    ('Analysis Dashboard', '/analysis', 'analytics'),
+    ('Data Manager', '/data_manager', 'storage'),
+    ('Pattern Manager', '/pattern_manager', 'pattern'),
+    ('Pattern Scanner', '/pattern_scanner', 'search'),
+)
+
+
 def render_navigation_drawer():
     """Render the left navigation drawer."""
     with ui.left_drawer(top_corner=True, bottom_corner=True).classes('bg-blue-grey-9'):
@@ -10,26 +19,9 @@ def render_navigation_drawer():
         ui.separator()
 
         with ui.column().classes('w-full gap-2 q-pa-md'):
-            ui.button(
-                'Analysis Dashboard',
-                on_click=lambda: ui.navigate.to('/analysis'),
-                icon='analytics'
-            ).props('flat align=left').classes('w-full')
-
-            ui.button(
-                'Data Manager',
-                on_click=lambda: ui.navigate.to('/data_manager'),
-                icon='storage'
-            ).props('flat align=left').classes('w-full')
-
-            ui.button(
-                'Pattern Manager',
-                on_click=lambda: ui.navigate.to('/pattern_manager'),
-                icon='pattern'
-            ).props('flat align=left').classes('w-full')
-
-            ui.button(
-                'Pattern Scanner',
-                on_click=lambda: ui.navigate.to('/pattern_scanner'),
-                icon='search'
-            ).props('flat align=left').classes('w-full')
+            for label, route, icon in _NAV_ITEMS:
+                ui.button(
+                    label,
+                    on_click=lambda route=route: ui.navigate.to(route),
+                    icon=icon
+                ).props('flat align=left').classes('w-full')
@@ -11,46 +11,42 @@ from views.data_manager import render_data_manager
 from views.analysis import render_analysis_dashboard
 
 
+def _render_layout():
+    """Render the header and navigation drawer shared by every page."""
+    render_header()
+    render_navigation_drawer()
+
+
 @ui.page('/')
 def main_page():
     """Main page with navigation."""
-    ui.dark_mode().enable()
-    render_header()
-    render_navigation_drawer()
+    _render_layout()
     render_home()
 
 
 @ui.page('/analysis')
 def analysis_page():
     """Analysis dashboard page."""
-    ui.dark_mode().enable()
-    render_header()
-    render_navigation_drawer()
+    _render_layout()
     render_analysis_dashboard(app_state)
 
 
 @ui.page('/data_manager')
 def data_manager_page():
     """Data manager page."""
-    ui.dark_mode().enable()
-    render_header()
-    render_navigation_drawer()
+    _render_layout()
     render_data_manager(app_state)
 
 
 @ui.page('/pattern_manager')
 def pattern_manager_page():
     """Pattern manager page."""
-    ui.dark_mode().enable()
-    render_header()
-    render_navigation_drawer()
+    _render_layout()
     render_pattern_manager(app_state)
 
 
 @ui.page('/pattern_scanner')
 def pattern_scanner_page():
     """Pattern scanner page."""
-    ui.dark_mode().enable()
-    render_header()
-    render_navigation_drawer()
+    _render_layout()
     render_pattern_scanner(app_state)
@@ -4,13 +4,16 @@
 class AppState:
     """Application-wide state management.
 
-    Separates JSON-serializable data from complex Python objects
-    to avoid serialization errors in NiceGUI.
+    Values live in a server-side object store by default. Only values
+    written with set_shared() go to the JSON-serializable data store, so
+    NiceGUI never has to serialize DataFrames or other complex objects.
     """
+    __slots__ = ('data', '_objects')
+
     def __init__(self):
-        # Simple, JSON-serializable data (strings, numbers, lists, dicts)
+        # JSON-serializable data explicitly shared via set_shared()
         self.data = {}
-        # Complex Python objects (DataFrames, custom classes, etc.)
+        # Everything else (the default for set() and item assignment)
         self._objects = {}
 
     def get(self, key, default=None):
@@ -20,12 +23,15 @@ class AppState:
         return self._objects.get(key, default)
 
     def set(self, key, value):
-        """Set value in appropriate storage based on type."""
-        # Check if value is JSON-serializable
-        if self._is_json_serializable(value):
-            self.data[key] = value
-        else:
-            self._objects[key] = value
+        """Set value in object storage."""
+        self.data.pop(key, None)
+        self._objects[key] = value
+        return value
+
+    def set_shared(self, key, value):
+        """Set a JSON-serializable value in data storage."""
+        self._objects.pop(key, None)
+        self.data[key] = value
         return value
 
     def __setitem__(self, key, value):
@@ -59,16 +65,6 @@ class AppState:
             return self._objects.pop(key, default)
         return default
 
-    @staticmethod
-    def _is_json_serializable(value):
-        """Check if a value is JSON serializable."""
-        import json
-        try:
-            json.dumps(value)
-            return True
-        except (TypeError, ValueError):
-            return False
-
 
 # Initialize global app state
 app_state = AppState()
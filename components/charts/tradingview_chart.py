@@ -1,9 +1,60 @@
 """TradingView Lightweight Charts component for NiceGUI."""
 
-from nicegui import ui
+from fastapi import Response
+from nicegui import app, run, ui
 import pandas as pd
+import numpy as np
+from collections import OrderedDict
 from typing import Optional
+import hashlib
+import secrets
 import json
+import weakref
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson is not installed
+    orjson = None
+
+
+# Candlestick payloads kept for /chart_data/{data_key} (LRU size)
+_PAYLOAD_CACHE_SIZE = 32
+
+# id(df) -> published data key. Each entry is evicted by a finalizer when its
+# DataFrame is garbage-collected, so a new frame reusing the id never sees it.
+_payload_cache = {}
+
+# Above this many bars, series markers slow every pan/zoom; the start arrow is drawn as a primitive
+_MARKER_BAR_LIMIT = 15000
+
+# Candlestick payloads served by /chart_data/{data_key} (LRU). Until the first
+# request an entry is a weak reference to its DataFrame, so unfetched charts do
+# not keep frames alive.
+_chart_data = OrderedDict()
+
+# Add TradingView library to the head of every page (once per process)
+ui.add_head_html(
+    '<script src="https://unpkg.com/lightweight-charts@4.2.3/dist/lightweight-charts.standalone.production.js"></script>',
+    shared=True
+)
+
+
+@app.get('/chart_data/{data_key}')
+async def _serve_chart_data(data_key: str):
+    """Serve a published candlestick payload, encoding it off the event loop on first request."""
+    payload = _chart_data.get(data_key)
+    if payload is None:
+        return Response(status_code=404)
+    if isinstance(payload, weakref.ref):
+        df = payload()
+        if df is None:
+            # The frame was collected before its chart fetched it
+            _chart_data.pop(data_key, None)
+            return Response(status_code=404)
+        payload = await run.io_bound(_prepare_candlestick_data, df)
+        if data_key in _chart_data:
+            _chart_data[data_key] = payload
+    return Response(payload, media_type='application/octet-stream', headers={'Cache-Control': 'max-age=3600'})
 
 
 def create_tradingview_chart(
@@ -16,7 +67,7 @@ def create_tradingview_chart(
     app_state: Optional[dict] = None,
     pattern_overlays: Optional[list] = None,
     on_pattern_click: Optional[callable] = None
-) -> None:
+) -> 'TradingViewChart':
     """
     Create a TradingView candlestick chart with pattern highlighting.
 
@@ -30,473 +81,90 @@ def create_tradingview_chart(
         app_state: Optional app state to persist zoom/pan position across reloads
         pattern_overlays: Optional list of pattern overlay dicts with keys: start_idx, end_idx, label, color, pattern_id
         on_pattern_click: Optional callback function when a pattern rectangle is clicked
+
+    Returns:
+        Handle for updating overlays and the visible range without re-rendering
     """
     if end_idx is None:
         end_idx = len(df)
 
-    # Prepare candlestick data
-    candlestick_data = _prepare_candlestick_data(df)
-    markers = _prepare_markers(df, start_idx, end_idx)
-
     # Prepare pattern overlays data
     if pattern_overlays is None:
         pattern_overlays = []
-    pattern_overlays_json = json.dumps(pattern_overlays)
 
-    # Generate unique chart ID
-    chart_id = f"tvChart_{id(df)}_{start_idx}"
+    # Generate chart ID that is stable across reruns with the same data
+    chart_id = _chart_id(df, start_idx, end_idx)
+
+    chart = TradingViewChart(chart_id, len(df))
 
-    # Add TradingView library to head (only once)
-    ui.add_head_html('''
-        <script src="https://unpkg.com/lightweight-charts@4.2.3/dist/lightweight-charts.standalone.production.js"></script>
-    ''')
+    # Publish candlestick data for the browser to fetch (cached across renders)
+    data_key = _publish_chart_data(df)
 
     # Create chart container
     chart_div = ui.element('div').props(f'id="{chart_id}"').style(f'width: 100%; height: {height}px;')
 
-    # Prepare data as JSON strings
-    data_json = json.dumps(candlestick_data)
-    markers_json = json.dumps(markers)
-
     # Get saved visible range from app_state if available
     saved_range = None
     if app_state is not None:
         saved_range = app_state.get('_chart_visible_range', None)
-    saved_range_json = json.dumps(saved_range) if saved_range else 'null'
 
-    # Create JavaScript for chart
-    chart_script = f'''
-    (function() {{
-        const chartDiv = document.getElementById('{chart_id}');
-        if (!chartDiv || typeof LightweightCharts === 'undefined') {{
-            console.error('Chart div or LightweightCharts not found');
-            return;
-        }}
-
-        // Create chart with dark theme
-        const chart = LightweightCharts.createChart(chartDiv, {{
-            width: chartDiv.clientWidth,
-            height: {height},
-            layout: {{
-                background: {{ color: '#1e1e1e' }},
-                textColor: '#d1d4dc',
-            }},
-            grid: {{
-                vertLines: {{ visible: false }},
-                horzLines: {{ visible: false }},
-            }},
-            crosshair: {{
-                mode: LightweightCharts.CrosshairMode.Normal,
-            }},
-            rightPriceScale: {{
-                borderColor: '#2a2e39',
-            }},
-            timeScale: {{
-                borderColor: '#2a2e39',
-                timeVisible: true,
-                secondsVisible: false,
-            }},
-        }});
-
-        // Add candlestick series
-        const candlestickSeries = chart.addCandlestickSeries({{
-            upColor: '#26a69a',
-            downColor: '#ef5350',
-            borderVisible: false,
-            wickUpColor: '#26a69a',
-            wickDownColor: '#ef5350',
-            priceLineVisible: false,
-            lastValueVisible: false,
-        }});
-
-        // Set data
-        const data = {data_json};
-        candlestickSeries.setData(data);
-
-        // Add markers
-        const markers = {markers_json};
-        if (markers.length > 0) {{
-            candlestickSeries.setMarkers(markers);
-        }}
-
-        // Add highlight region
-        const highlightStart = {start_idx};
-        const highlightEnd = {end_idx};
-
-        if (highlightStart < data.length && highlightEnd <= data.length && highlightEnd > highlightStart) {{
-            const startTime = data[highlightStart].time;
-            const endTime = data[highlightEnd - 1].time;
-
-            // Get price range for highlighted region
-            const highlightData = data.slice(highlightStart, highlightEnd);
-            const maxPrice = Math.max(...highlightData.map(d => d.high));
-            const minPrice = Math.min(...highlightData.map(d => d.low));
-            const priceRange = maxPrice - minPrice;
-
-            // Add filled rectangle for highlighting (using priceLine workaround)
-            const upperLine = chart.addLineSeries({{
-                color: 'rgba(255, 165, 0, 0.3)',
-                lineWidth: 1,
-                priceLineVisible: false,
-                lastValueVisible: false,
-                crosshairMarkerVisible: false,
-            }});
+    # DOM event types the chart script dispatches on the chart container (None = no listener).
+    # Listening on the container rather than page-wide ties the handlers to this element, so
+    # they go away with it when the surrounding UI is refreshed instead of piling up.
+    events = {'click': None, 'contextMenu': None, 'patternClick': None, 'range': None}
 
-            const lowerLine = chart.addLineSeries({{
-                color: 'rgba(255, 165, 0, 0.3)',
-                lineWidth: 1,
-                priceLineVisible: false,
-                lastValueVisible: false,
-                crosshairMarkerVisible: false,
-            }});
-
-            // Create box outline
-            upperLine.setData([
-                {{ time: startTime, value: maxPrice + priceRange * 0.02 }},
-                {{ time: endTime, value: maxPrice + priceRange * 0.02 }}
-            ]);
-
-            lowerLine.setData([
-                {{ time: startTime, value: minPrice - priceRange * 0.02 }},
-                {{ time: endTime, value: minPrice - priceRange * 0.02 }}
-            ]);
-
-            // Add vertical line at start index
-            const startBar = data[highlightStart];
-            const startVerticalLine = chart.addLineSeries({{
-                color: '#00ff00',
-                lineWidth: 2,
-                lineStyle: 2, // Dashed line
-                priceLineVisible: false,
-                lastValueVisible: false,
-                crosshairMarkerVisible: false,
-            }});
-
-            // Create vertical line effect by drawing from min to max price at start time
-            startVerticalLine.setData([
-                {{ time: startTime, value: minPrice - priceRange * 0.05 }},
-                {{ time: startTime, value: maxPrice + priceRange * 0.05 }}
-            ]);
-        }}
-
-        // Reusable function to draw a rectangle on the chart
-        function drawRectangle(startIdx, endIdx, color, lineWidth = 1, lineStyle = 1) {{
-            if (startIdx >= data.length || endIdx > data.length || endIdx <= startIdx) {{
-                return;
-            }}
-
-            const startTime = data[startIdx].time;
-            const endTime = data[endIdx - 1].time;
-
-            // Get price range for the region
-            const regionData = data.slice(startIdx, endIdx);
-            const maxPrice = Math.max(...regionData.map(d => d.high));
-            const minPrice = Math.min(...regionData.map(d => d.low));
-            const priceRange = maxPrice - minPrice;
-            const padding = priceRange * 0.02;
-
-            // Common line options
-            const lineOptions = {{
-                color: color,
-                lineWidth: lineWidth,
-                lineStyle: lineStyle,
-                priceLineVisible: false,
-                lastValueVisible: false,
-                crosshairMarkerVisible: false,
-            }};
-
-            // Create four line series for the rectangle borders
-            const topLine = chart.addLineSeries(lineOptions);
-            const bottomLine = chart.addLineSeries(lineOptions);
-            const leftLine = chart.addLineSeries(lineOptions);
-            const rightLine = chart.addLineSeries(lineOptions);
-
-            // Draw top border
-            topLine.setData([
-                {{ time: startTime, value: maxPrice + padding }},
-                {{ time: endTime, value: maxPrice + padding }}
-            ]);
-
-            // Draw bottom border
-            bottomLine.setData([
-                {{ time: startTime, value: minPrice - padding }},
-                {{ time: endTime, value: minPrice - padding }}
-            ]);
-
-            // Draw left border
-            leftLine.setData([
-                {{ time: startTime, value: minPrice - padding }},
-                {{ time: startTime, value: maxPrice + padding }}
-            ]);
-
-            // Draw right border
-            rightLine.setData([
-                {{ time: endTime, value: minPrice - padding }},
-                {{ time: endTime, value: maxPrice + padding }}
-            ]);
-        }}
-
-        // Draw pattern overlays
-        const patternOverlays = {pattern_overlays_json};
-        patternOverlays.forEach((pattern) => {{
-            const color = pattern.color //.replace('0.5', '0.8');  // More opaque for border
-            drawRectangle(pattern.start_idx, pattern.end_idx, color, 2, 1);
-        }});
-
-        // Create context menu HTML
-        const contextMenu = document.createElement('div');
-        contextMenu.id = '{chart_id}_contextmenu';
-        contextMenu.style.cssText = `
-            position: fixed;
-            display: none;
-            background: #2a2e39;
-            border: 1px solid #434651;
-            border-radius: 4px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.3);
-            z-index: 10000;
-            padding: 4px 0;
-            min-width: 150px;
-        `;
-
-        const menuItems = [
-            {{ label: 'Set Start Date', action: 'start_date' }},
-            {{ label: 'Set End Date', action: 'end_date' }}
-        ];
-
-        menuItems.forEach(item => {{
-            const menuItem = document.createElement('div');
-            menuItem.textContent = item.label;
-            menuItem.style.cssText = `
-                padding: 8px 16px;
-                cursor: pointer;
-                color: #d1d4dc;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                font-size: 14px;
-            `;
-            menuItem.addEventListener('mouseenter', () => {{
-                menuItem.style.background = '#434651';
-            }});
-            menuItem.addEventListener('mouseleave', () => {{
-                menuItem.style.background = 'transparent';
-            }});
-            menuItem.dataset.action = item.action;
-            contextMenu.appendChild(menuItem);
-        }});
-
-        document.body.appendChild(contextMenu);
-
-        // Store context menu data
-        let contextMenuData = null;
-
-        // Handle right-click on chart
-        chartDiv.addEventListener('contextmenu', (e) => {{
-            e.preventDefault();
-
-            // Get the position within the chart
-            const rect = chartDiv.getBoundingClientRect();
-            const x = e.clientX - rect.left;
-            const y = e.clientY - rect.top;
-
-            // Get the time at this position
-            const timeScale = chart.timeScale();
-            const time = timeScale.coordinateToTime(x);
-
-            if (time) {{
-                // Find the bar data
-                const barIndex = data.findIndex(d => d.time === time);
-                if (barIndex >= 0) {{
-                    const barData = data[barIndex];
-
-                    // Store the bar data
-                    contextMenuData = {{
-                        index: barData.index,
-                        time: new Date(barData.time * 1000).toLocaleString(),
-                        open: barData.open.toFixed(2),
-                        high: barData.high.toFixed(2),
-                        low: barData.low.toFixed(2),
-                        close: barData.close.toFixed(2),
-                        change: ((barData.close - barData.open) / barData.open * 100).toFixed(2)
-                    }};
-
-                    // Show context menu at cursor position
-                    contextMenu.style.display = 'block';
-                    contextMenu.style.left = e.clientX + 'px';
-                    contextMenu.style.top = e.clientY + 'px';
-                }}
-            }}
-        }});
-
-        // Handle context menu item clicks
-        contextMenu.addEventListener('click', (e) => {{
-            const menuItem = e.target.closest('div[data-action]');
-            if (menuItem && contextMenuData) {{
-                const action = menuItem.dataset.action;
-
-                // Send event to Python with action type
-                window.dispatchEvent(new CustomEvent('tvChartContextMenu', {{
-                    detail: {{
-                        ...contextMenuData,
-                        action: action
-                    }}
-                }}));
-
-                // Hide menu
-                contextMenu.style.display = 'none';
-                contextMenuData = null;
-            }}
-        }});
+    # If callback provided, create event listener
+    if on_bar_click:
+        events['click'] = 'tvclick'
 
-        // Hide context menu when clicking elsewhere
-        document.addEventListener('click', () => {{
-            contextMenu.style.display = 'none';
-        }});
+        # Attach Python event handler
+        chart_div.on(
+            events['click'],
+            lambda e: on_bar_click({**e.args, **_bar_details(df, e.args['index'])}),
+            js_handler=_DETAIL_JS_HANDLER
+        )
 
-        // Handle regular click events (left-click)
-        chart.subscribeClick(param => {{
-            if (!param.point || !param.time) return;
+    # If context menu callback provided, create event listener
+    if on_context_menu:
+        events['contextMenu'] = 'tvcontextmenu'
 
-            const barIndex = data.findIndex(d => d.time === param.time);
-            if (barIndex < 0) return;
+        # Attach Python event handler
+        chart_div.on(
+            events['contextMenu'],
+            lambda e: on_context_menu({**e.args, **_bar_details(df, e.args['index'])}),
+            js_handler=_DETAIL_JS_HANDLER
+        )
 
-            // Get the clicked bar's price data
-            const price = param.seriesData.get(candlestickSeries);
-            if (!price) return;
+    # If pattern click callback provided, create event listener
+    if on_pattern_click:
+        events['patternClick'] = 'tvpatternclick'
 
-            // Get click Y coordinate and convert to price
-            const clickY = param.point.y;
-            const clickPrice = candlestickSeries.coordinateToPrice(clickY);
+        # Attach Python event handler
+        chart_div.on(events['patternClick'], lambda e: on_pattern_click(e.args), js_handler=_DETAIL_JS_HANDLER)
 
-            // Check if click is on any edge of any pattern rectangle
-            const patternOverlays = {pattern_overlays_json};
+    # If app_state provided, set up event listener to save zoom/pan position
+    if app_state is not None:
+        events['range'] = 'tvrange'
 
-            // First pass: Find all matching patterns at this click location
-            const matchingPatterns = [];
+        # Attach Python event handler to save visible range
+        def save_visible_range(e):
+            app_state['_chart_visible_range'] = e.args
 
-            for (const pattern of patternOverlays) {{
-                // Get the price range for the pattern
-                const regionData = data.slice(pattern.start_idx, pattern.end_idx);
-                const maxPrice = Math.max(...regionData.map(d => d.high));
-                const minPrice = Math.min(...regionData.map(d => d.low));
-                const priceRange = maxPrice - minPrice;
-                const padding = priceRange * 0.02;
-                const tolerance = priceRange * 0.10; // 10% tolerance for clicking near edge
-
-                const upperBound = maxPrice + padding;
-                const lowerBound = minPrice - padding;
-
-                // Check if click is within the horizontal range of the pattern
-                const isWithinHorizontalRange = barIndex >= pattern.start_idx && barIndex < pattern.end_idx;
-
-                // Check if click is on pattern boundary (edges or anywhere inside/near the rectangle)
-                let isOnPattern = false;
-
-                // Check if click is anywhere within or near the pattern rectangle bounds
-                if (isWithinHorizontalRange && clickPrice >= lowerBound - tolerance && clickPrice <= upperBound + tolerance) {{
-                    isOnPattern = true;
-                }}
-
-                // Also check vertical edges (left and right)
-                if ((barIndex === pattern.start_idx || barIndex === pattern.end_idx - 1) &&
-                    clickPrice >= lowerBound - tolerance && clickPrice <= upperBound + tolerance) {{
-                    isOnPattern = true;
-                }}
-
-                if (isOnPattern) {{
-                    matchingPatterns.push(pattern);
-                }}
-            }}
-
-            // If any patterns matched, prioritize the highlighted one (with green color)
-            if (matchingPatterns.length > 0) {{
-                // Find highlighted pattern (lime green with high opacity)
-                let selectedPattern = matchingPatterns.find(p => p.color === 'rgba(50, 205, 50, 0.8)');
-
-                // If no highlighted pattern, use the first match
-                if (!selectedPattern) {{
-                    selectedPattern = matchingPatterns[0];
-                }}
-
-                console.log('Pattern clicked:', {{
-                    barIndex: barIndex,
-                    clickPrice: clickPrice,
-                    pattern: selectedPattern.label,
-                    pattern_id: selectedPattern.pattern_id
-                }});
-
-                // Click is on pattern
-                window.dispatchEvent(new CustomEvent('tvChartPatternClick', {{
-                    detail: {{
-                        pattern_id: selectedPattern.pattern_id,
-                        label: selectedPattern.label,
-                        start_idx: selectedPattern.start_idx,
-                        end_idx: selectedPattern.end_idx
-                    }}
-                }}));
-                return;  // Don't process as bar click
-            }}
-
-            // If not on pattern edge, handle as bar click
-            if (price) {{
-                const barData = data[barIndex];
-
-                // Create timestamp string
-                const date = new Date(barData.time * 1000);
-                const timeStr = date.toLocaleString();
-
-                const eventData = {{
-                    index: barData.index,
-                    time: timeStr,
-                    open: barData.open.toFixed(2),
-                    high: barData.high.toFixed(2),
-                    low: barData.low.toFixed(2),
-                    close: barData.close.toFixed(2),
-                    change: ((barData.close - barData.open) / barData.open * 100).toFixed(2)
-                }};
-
-                // Send data to Python
-                window.dispatchEvent(new CustomEvent('tvChartClick', {{
-                    detail: eventData
-                }}));
-            }}
-        }});
-
-        // Handle resize
-        const resizeObserver = new ResizeObserver(entries => {{
-            if (entries.length === 0 || entries[0].target !== chartDiv) return;
-            const newRect = entries[0].contentRect;
-            chart.applyOptions({{ width: newRect.width }});
-        }});
-        resizeObserver.observe(chartDiv);
-
-        // Restore saved zoom/pan or fit content
-        const savedRange = {saved_range_json};
-        if (savedRange && savedRange.from && savedRange.to) {{
-            setTimeout(() => {{
-                chart.timeScale().setVisibleRange({{
-                    from: savedRange.from,
-                    to: savedRange.to
-                }});
-            }}, 100);
-        }} else {{
-            // Fit content to view on first load
-            setTimeout(() => chart.timeScale().fitContent(), 100);
-        }}
-
-        // Save visible range when user zooms/pans
-        chart.timeScale().subscribeVisibleTimeRangeChange(() => {{
-            const visibleRange = chart.timeScale().getVisibleRange();
-            if (visibleRange) {{
-                // Send to Python to save in app_state
-                window.dispatchEvent(new CustomEvent('tvChartRangeChange', {{
-                    detail: {{
-                        from: visibleRange.from,
-                        to: visibleRange.to
-                    }}
-                }}));
-            }}
-        }});
-    }})();
-    '''
+        chart_div.on(events['range'], save_visible_range, js_handler=_DETAIL_JS_HANDLER)
+
+    # Fill the chart script template with this chart's parameters
+    params = {
+        'chartId': chart_id,
+        'height': height,
+        'dataKey': data_key,
+        'startArrow': len(df) > _MARKER_BAR_LIMIT,
+        'highlightStart': start_idx,
+        'highlightEnd': end_idx,
+        'patternOverlays': pattern_overlays,
+        'savedRange': saved_range or None,
+        'events': events,
+    }
+    chart_script = _CHART_JS_TEMPLATE.replace('__PARAMS__', _dumps(params).decode(), 1)
 
     # Store chart reference for later
     chart_div._props['data-chart-id'] = chart_id
@@ -504,115 +172,756 @@ def create_tradingview_chart(
     # Run the JavaScript to create the chart
     ui.run_javascript(chart_script, timeout=10.0)
 
-    # If callback provided, create event listener
-    if on_bar_click:
-        event_name = f'{chart_id}_click'
-
-        # Set up JavaScript event listener to bridge to Python
-        emit_script = f'''
-        window.addEventListener('tvChartClick', (event) => {{
-            emitEvent('{event_name}', event.detail);
-        }});
-        '''
-        ui.run_javascript(emit_script)
-
-        # Attach Python event handler
-        ui.on(event_name, lambda e: on_bar_click(e.args))
+    return chart
+
+
+class TradingViewChart:
+    """Handle to a rendered chart for in-place updates from event handlers."""
+
+    def __init__(self, chart_id: str, n_rows: int):
+        """
+        Initialize chart handle.
+
+        Args:
+            chart_id: DOM id of the chart container
+            n_rows: Number of rows (bars) in the charted DataFrame
+        """
+        self.chart_id = chart_id
+        self._n_rows = n_rows
+
+    def set_pattern_overlays(self, pattern_overlays: list) -> None:
+        """Redraw the pattern overlay rectangles (same dict format as create_tradingview_chart)."""
+        self._call('setOverlays', pattern_overlays)
+
+    def set_highlight(self, start_idx: int, end_idx: Optional[int] = None) -> None:
+        """Move the start marker and highlighted region to rows [start_idx, end_idx)."""
+        if end_idx is None:
+            end_idx = self._n_rows
+        self._call('setHighlight', start_idx, end_idx)
+
+    def set_visible_range(self, visible_range: dict) -> None:
+        """Scroll the time axis to a {'from': unix_seconds, 'to': unix_seconds} range."""
+        self._call('setVisibleRange', visible_range)
+
+    def _call(self, method: str, *arguments) -> None:
+        """Invoke a method of the chart's browser-side update API."""
+        args = ', '.join(_dumps(argument).decode() for argument in arguments)
+        ui.run_javascript(f"document.getElementById('{self.chart_id}')?.__tvApi?.{method}({args});")
+
+
+def _bar_details(df: pd.DataFrame, index: int) -> dict:
+    """Format the OHLC fields of a clicked bar for event callbacks."""
+    row = df.iloc[index]
+    timestamp = df.index[index]
+    if isinstance(timestamp, pd.Timestamp):
+        timestamp = timestamp.strftime('%Y-%m-%d %H:%M:%S')
+
+    return {
+        'index': index,
+        'time': str(timestamp),
+        'open': f"{row['open']:.2f}",
+        'high': f"{row['high']:.2f}",
+        'low': f"{row['low']:.2f}",
+        'close': f"{row['close']:.2f}",
+        'change': f"{(row['close'] - row['open']) / row['open'] * 100:.2f}"
+    }
+
+
+def _chart_id(df: pd.DataFrame, start_idx: int, end_idx: Optional[int]) -> str:
+    """Build a DOM id from the data fingerprint rather than the object identity."""
+    if len(df) == 0:
+        fingerprint = f'empty_{start_idx}_{end_idx}'
+    else:
+        fingerprint = f'{df.index[0]}_{df.index[-1]}_{len(df)}_{start_idx}_{end_idx}'
+    return f"tvChart_{hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()}"
 
-    # If context menu callback provided, create event listener
-    if on_context_menu:
-        context_event_name = f'{chart_id}_contextmenu'
 
-        # Set up JavaScript event listener to bridge to Python
-        context_emit_script = f'''
-        window.addEventListener('tvChartContextMenu', (event) => {{
-            emitEvent('{context_event_name}', event.detail);
-        }});
-        '''
-        ui.run_javascript(context_emit_script)
+def _dumps(obj) -> bytes:
+    """Encode obj (which may contain ndarrays) as JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=lambda value: value.tolist()).encode()
 
-        # Attach Python event handler
-        ui.on(context_event_name, lambda e: on_context_menu(e.args))
 
-    # If pattern click callback provided, create event listener
-    if on_pattern_click:
-        pattern_event_name = f'{chart_id}_pattern_click'
+def _lru_put(cache: OrderedDict, key, value) -> None:
+    """Store value as the most recent entry, evicting the oldest beyond the cache size."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _PAYLOAD_CACHE_SIZE:
+        cache.popitem(last=False)
 
-        # Set up JavaScript event listener to bridge to Python
-        pattern_emit_script = f'''
-        window.addEventListener('tvChartPatternClick', (event) => {{
-            emitEvent('{pattern_event_name}', event.detail);
-        }});
-        '''
-        ui.run_javascript(pattern_emit_script)
 
-        # Attach Python event handler
-        ui.on(pattern_event_name, lambda e: on_pattern_click(e.args))
+def _publish_chart_data(df: pd.DataFrame) -> str:
+    """
+    Register the candlestick payload for df at /chart_data/<key> and return the key.
 
-    # If app_state provided, set up event listener to save zoom/pan position
-    if app_state is not None:
-        range_event_name = f'{chart_id}_range'
+    Encoding is deferred to the first request for the key, so rendering the page
+    never serializes the frame.
+    """
+    key = id(df)
+    data_key = _payload_cache.get(key)
+    if data_key in _chart_data:
+        _chart_data.move_to_end(data_key)
+        return data_key
 
-        # Set up JavaScript event listener to bridge to Python
-        range_emit_script = f'''
-        window.addEventListener('tvChartRangeChange', (event) => {{
-            emitEvent('{range_event_name}', event.detail);
-        }});
-        '''
-        ui.run_javascript(range_emit_script)
+    if data_key is None:
+        weakref.finalize(df, _payload_cache.pop, key, None)
 
-        # Attach Python event handler to save visible range
-        def save_visible_range(e):
-            app_state['_chart_visible_range'] = e.args
+    # A payload evicted from _chart_data is re-registered under a fresh key
+    data_key = secrets.token_hex(16)
+    _lru_put(_chart_data, data_key, weakref.ref(df))
+    _payload_cache[key] = data_key
+    return data_key
 
-        ui.on(range_event_name, save_visible_range)
 
+def _prepare_candlestick_data(df: pd.DataFrame) -> bytes:
+    """
+    Convert DataFrame to the binary candlestick payload read by the chart script.
 
-def _prepare_candlestick_data(df: pd.DataFrame):
-    """Convert DataFrame to TradingView format."""
-    data = []
-    df_copy = df.copy()
+    Args:
+        df: DataFrame with OHLC data
 
+    Returns:
+        N uint32 Unix times followed by N float32 values each for open, high, low
+        and close (float32 is ample precision for display)
+    """
     # Filter out rows with invalid/null OHLC prices (weekends/holidays)
-    #df_copy = df_copy.dropna(subset=['open', 'high', 'low', 'close'])
+    #df = df.dropna(subset=['open', 'high', 'low', 'close'])
 
     # Convert timestamps to Unix timestamps (seconds)
-    if isinstance(df_copy.index, pd.DatetimeIndex):
-        timestamps = (df_copy.index.astype(int) // 10**9).tolist()
+    if isinstance(df.index, pd.DatetimeIndex):
+        timestamps = df.index.as_unit('s').asi8
     else:
-        timestamps = list(range(len(df_copy)))
+        timestamps = np.arange(len(df), dtype=np.int64)
+
+    # Times are packed as uint32 seconds; refuse anything that would wrap around
+    if len(timestamps) and (timestamps.min() < 0 or timestamps.max() > np.iinfo(np.uint32).max):
+        raise ValueError(
+            'Chart timestamps must fall between 1970-01-01 and 2106-02-07 UTC to pack as uint32 seconds'
+        )
 
-    for i, (timestamp, row) in enumerate(zip(timestamps, df_copy.itertuples())):
-        data.append({
-            'time': timestamp,
-            'open': float(row.open),
-            'high': float(row.high),
-            'low': float(row.low),
-            'close': float(row.close),
-            'index': i
-        })
+    # Planar price block, one row per OHLC column
+    prices = np.empty((4, len(df)), dtype=np.float32)
+    for row, column in enumerate(('open', 'high', 'low', 'close')):
+        prices[row] = df[column].to_numpy()
 
-    return data
+    return timestamps.astype('<u4').tobytes() + prices.astype('<f4', copy=False).tobytes()
 
 
-def _prepare_markers(df: pd.DataFrame, start_idx: int, end_idx: Optional[int]):
-    """Create markers for pattern boundaries."""
-    if start_idx is None or start_idx >= len(df):
-        return []
+# Forwards a chart CustomEvent's payload to the Python handler as its args
+_DETAIL_JS_HANDLER = '(event) => emit(event.detail)'
+
+# Chart script; __PARAMS__ is replaced with the JSON parameters of each chart
+_CHART_JS_TEMPLATE = '''
+    (function(params) {
+        const chartDiv = document.getElementById(params.chartId);
+        if (!chartDiv || typeof LightweightCharts === 'undefined') {
+            console.error('Chart div or LightweightCharts not found');
+            return;
+        }
+
+        // Dispatch an event on the container for its Python handler, if one is registered
+        function emit(eventName, detail) {
+            if (eventName) chartDiv.dispatchEvent(new CustomEvent(eventName, { detail }));
+        }
+
+        // Skip re-creation when this container already holds the chart
+        if (chartDiv.dataset.initialized === '1') return;
+        chartDiv.dataset.initialized = '1';
+
+        // Updates pushed from Python; stored in params until the chart exists, then applied live
+        let liveApi = null;
+        chartDiv.__tvApi = {
+            setOverlays(overlays) {
+                params.patternOverlays = overlays;
+                if (liveApi) liveApi.setOverlays(overlays);
+            },
+            setVisibleRange(range) {
+                params.savedRange = range;
+                if (liveApi) liveApi.setVisibleRange(range);
+            },
+            setHighlight(start, end) {
+                params.highlightStart = start;
+                params.highlightEnd = end;
+                if (liveApi) liveApi.setHighlight(start, end);
+            },
+        };
+
+        // Defer chart construction until the container scrolls into view
+        const io = new IntersectionObserver((entries) => {
+            if (!entries.some(entry => entry.isIntersecting)) return;
+            io.disconnect();
+            initChart();
+        });
+        io.observe(chartDiv);
+
+        async function initChart() {
+            // Create chart with dark theme
+            const chart = LightweightCharts.createChart(chartDiv, {
+                width: chartDiv.clientWidth,
+                height: params.height,
+                layout: {
+                    background: { color: '#1e1e1e' },
+                    textColor: '#d1d4dc',
+                },
+                grid: {
+                    vertLines: { visible: false },
+                    horzLines: { visible: false },
+                },
+                crosshair: {
+                    mode: LightweightCharts.CrosshairMode.Normal,
+                },
+                rightPriceScale: {
+                    borderColor: '#2a2e39',
+                },
+                timeScale: {
+                    borderColor: '#2a2e39',
+                    timeVisible: true,
+                    secondsVisible: false,
+                },
+            });
+
+            // Add candlestick series
+            const candlestickSeries = chart.addCandlestickSeries({
+                upColor: '#26a69a',
+                downColor: '#ef5350',
+                borderVisible: false,
+                wickUpColor: '#26a69a',
+                wickDownColor: '#ef5350',
+                priceLineVisible: false,
+                lastValueVisible: false,
+            });
 
-    markers = []
-    timestamps = (df.index.astype(int) // 10**9).tolist()
+            // Fetch binary payload (uint32 times, then float32 open/high/low/close blocks)
+            const response = await fetch('/chart_data/' + params.dataKey);
+            if (!response.ok) {
+                console.error('Chart data not available');
+                return;
+            }
+            const buffer = await response.arrayBuffer();
+            const count = buffer.byteLength / 20;
+            const times = new Uint32Array(buffer, 0, count);
+            const prices = new Float32Array(buffer, count * 4, count * 4);
+
+            // Expand into bar objects once
+            const data = new Array(count);
+            for (let i = 0; i < count; i++) {
+                data[i] = {
+                    time: times[i],
+                    open: prices[i],
+                    high: prices[count + i],
+                    low: prices[2 * count + i],
+                    close: prices[3 * count + i]
+                };
+            }
+
+            // Set data
+            candlestickSeries.setData(data);
+
+            // Canvas dash pattern for a lightweight-charts LineStyle value
+            function lineDash(lineStyle, width) {
+                switch (lineStyle) {
+                    case 1: return [width, width];          // Dotted
+                    case 2: return [2 * width, 2 * width];  // Dashed
+                    case 3: return [6 * width, 6 * width];  // LargeDashed
+                    case 4: return [width, 4 * width];      // SparseDotted
+                    default: return [];                     // Solid
+                }
+            }
+
+            // Minimal series primitive; subclasses draw in _draw(target)
+            class CanvasPrimitive {
+                constructor(zOrder) {
+                    this._chart = null;
+                    this._series = null;
+                    this._paneView = {
+                        zOrder: () => zOrder,
+                        renderer: () => ({ draw: target => this._draw(target) }),
+                    };
+                }
+
+                attached({ chart, series }) {
+                    this._chart = chart;
+                    this._series = series;
+                }
+
+                detached() {
+                    this._chart = null;
+                    this._series = null;
+                }
+
+                updateAllViews() {}
+
+                paneViews() {
+                    return [this._paneView];
+                }
+            }
+
+            // Rectangle (and optional start line) drawn in one canvas pass
+            class BoxPrimitive extends CanvasPrimitive {
+                constructor(box) {
+                    super(box.zOrder || 'bottom');
+                    this._box = box;
+                }
+
+                _draw(target) {
+                    if (!this._series) return;
+                    const box = this._box;
+                    const timeScale = this._chart.timeScale();
+                    const x1 = timeScale.timeToCoordinate(box.startTime);
+                    const x2 = timeScale.timeToCoordinate(box.endTime);
+                    const y1 = this._series.priceToCoordinate(box.top);
+                    const y2 = this._series.priceToCoordinate(box.bottom);
+                    if (x1 === null || x2 === null || y1 === null || y2 === null) return;
+
+                    const line = box.startLine;
+                    const lineTop = line ? this._series.priceToCoordinate(line.top) : null;
+                    const lineBottom = line ? this._series.priceToCoordinate(line.bottom) : null;
+
+                    target.useBitmapCoordinateSpace(scope => {
+                        const ctx = scope.context;
+                        const hRatio = scope.horizontalPixelRatio;
+                        const vRatio = scope.verticalPixelRatio;
+                        const left = Math.round(Math.min(x1, x2) * hRatio);
+                        const top = Math.round(Math.min(y1, y2) * vRatio);
+                        const width = Math.round(Math.abs(x2 - x1) * hRatio);
+                        const height = Math.round(Math.abs(y2 - y1) * vRatio);
+
+                        if (box.fillColor) {
+                            ctx.fillStyle = box.fillColor;
+                            ctx.fillRect(left, top, width, height);
+                        }
+                        if (box.borderColor) {
+                            const borderWidth = (box.borderWidth || 1) * hRatio;
+                            ctx.lineWidth = borderWidth;
+                            ctx.strokeStyle = box.borderColor;
+                            ctx.setLineDash(lineDash(box.borderStyle, borderWidth));
+                            ctx.strokeRect(left, top, width, height);
+                        }
+                        if (line && lineTop !== null && lineBottom !== null) {
+                            const lineWidth = (line.width || 1) * hRatio;
+                            const x = Math.round(x1 * hRatio);
+                            ctx.lineWidth = lineWidth;
+                            ctx.strokeStyle = line.color;
+                            ctx.setLineDash(lineDash(line.style, lineWidth));
+                            ctx.beginPath();
+                            ctx.moveTo(x, Math.round(lineTop * vRatio));
+                            ctx.lineTo(x, Math.round(lineBottom * vRatio));
+                            ctx.stroke();
+                        }
+                        ctx.setLineDash([]);
+                    });
+                }
+            }
+
+            // Highest high and lowest low over data[startIdx, endIdx) in one pass
+            function getPriceRange(startIdx, endIdx) {
+                let maxPrice = -Infinity;
+                let minPrice = Infinity;
+                for (let i = startIdx; i < endIdx; i++) {
+                    const d = data[i];
+                    if (d.high > maxPrice) maxPrice = d.high;
+                    if (d.low < minPrice) minPrice = d.low;
+                }
+                return { maxPrice, minPrice };
+            }
+
+            // Down arrow with label above a bar, standing in for a series marker
+            class StartArrowPrimitive extends CanvasPrimitive {
+                constructor(time, price, color, text) {
+                    super('top');
+                    this._time = time;
+                    this._price = price;
+                    this._color = color;
+                    this._text = text;
+                }
+
+                _draw(target) {
+                    if (!this._series) return;
+                    const x = this._chart.timeScale().timeToCoordinate(this._time);
+                    const y = this._series.priceToCoordinate(this._price);
+                    if (x === null || y === null) return;
+
+                    target.useBitmapCoordinateSpace(scope => {
+                        const ctx = scope.context;
+                        const hRatio = scope.horizontalPixelRatio;
+                        const vRatio = scope.verticalPixelRatio;
+                        const cx = x * hRatio;
+                        const tip = (y - 4) * vRatio;
+                        const base = tip - 9 * vRatio;
+
+                        ctx.fillStyle = this._color;
+                        ctx.beginPath();
+                        ctx.moveTo(cx, tip);
+                        ctx.lineTo(cx - 6 * hRatio, base);
+                        ctx.lineTo(cx + 6 * hRatio, base);
+                        ctx.closePath();
+                        ctx.fill();
+
+                        ctx.font = `${12 * vRatio}px sans-serif`;
+                        ctx.textAlign = 'center';
+                        ctx.textBaseline = 'bottom';
+                        ctx.fillText(this._text, cx, base - 2 * vRatio);
+                    });
+                }
+            }
+
+            // Start marker and highlight region, replacing any drawn before
+            let highlightPrimitives = [];
+            function drawHighlight(highlightStart, highlightEnd) {
+                highlightPrimitives.forEach(primitive => candlestickSeries.detachPrimitive(primitive));
+                highlightPrimitives = [];
+                candlestickSeries.setMarkers([]);
+                if (highlightStart >= data.length) return;
+
+                // Large charts skip series markers (recomputed on every update); draw the start arrow instead
+                const startBar = data[highlightStart];
+                if (params.startArrow) {
+                    highlightPrimitives.push(new StartArrowPrimitive(startBar.time, startBar.high, '#f68410', 'Start'));
+                } else {
+                    candlestickSeries.setMarkers([{
+                        time: startBar.time,
+                        position: 'aboveBar',
+                        color: '#f68410',
+                        shape: 'arrowDown',
+                        text: 'Start'
+                    }]);
+                }
+
+                if (highlightEnd <= data.length && highlightEnd > highlightStart) {
+                    const startTime = startBar.time;
+                    const endTime = data[highlightEnd - 1].time;
+
+                    // Get price range for highlighted region
+                    const { maxPrice, minPrice } = getPriceRange(highlightStart, highlightEnd);
+                    const priceRange = maxPrice - minPrice;
+
+                    // Add filled rectangle and dashed start line as a single primitive
+                    highlightPrimitives.push(new BoxPrimitive({
+                        startTime: startTime,
+                        endTime: endTime,
+                        top: maxPrice + priceRange * 0.02,
+                        bottom: minPrice - priceRange * 0.02,
+                        fillColor: 'rgba(255, 165, 0, 0.08)',
+                        borderColor: 'rgba(255, 165, 0, 0.3)',
+                        startLine: {
+                            color: '#00ff00',
+                            width: 2,
+                            style: 2, // Dashed line
+                            top: maxPrice + priceRange * 0.05,
+                            bottom: minPrice - priceRange * 0.05,
+                        },
+                    }));
+                }
+                highlightPrimitives.forEach(primitive => candlestickSeries.attachPrimitive(primitive));
+            }
+            drawHighlight(params.highlightStart, params.highlightEnd);
+
+            // Reusable function to draw a rectangle on the chart; returns the attached primitive
+            function drawRectangle(startIdx, endIdx, color, lineWidth = 1, lineStyle = 1) {
+                if (startIdx >= data.length || endIdx > data.length || endIdx <= startIdx) {
+                    return null;
+                }
+
+                const startTime = data[startIdx].time;
+                const endTime = data[endIdx - 1].time;
+
+                // Get price range for the region
+                const { maxPrice, minPrice } = getPriceRange(startIdx, endIdx);
+                const priceRange = maxPrice - minPrice;
+                const padding = priceRange * 0.02;
 
-    # Start marker
-    if start_idx < len(timestamps):
-        markers.append({
-            'time': timestamps[start_idx],
-            'position': 'aboveBar',
-            'color': '#f68410',
-            'shape': 'arrowDown',
-            'text': 'Start'
-        })
+                // Outline the region with one primitive drawn above the candles
+                const primitive = new BoxPrimitive({
+                    startTime: startTime,
+                    endTime: endTime,
+                    top: maxPrice + padding,
+                    bottom: minPrice - padding,
+                    borderColor: color,
+                    borderWidth: lineWidth,
+                    borderStyle: lineStyle,
+                    zOrder: 'top',
+                });
+                candlestickSeries.attachPrimitive(primitive);
+                return primitive;
+            }
+
+            // Draw pattern overlays, replacing any drawn before
+            let overlayPrimitives = [];
+            function drawPatternOverlays(patternOverlays) {
+                overlayPrimitives.forEach(primitive => candlestickSeries.detachPrimitive(primitive));
+                overlayPrimitives = [];
+                patternOverlays.forEach((pattern) => {
+                    const color = pattern.color //.replace('0.5', '0.8');  // More opaque for border
+                    const primitive = drawRectangle(pattern.start_idx, pattern.end_idx, color, 2, 1);
+                    if (primitive) overlayPrimitives.push(primitive);
+                });
+            }
+            drawPatternOverlays(params.patternOverlays);
+
+            // Create context menu HTML
+            const contextMenu = document.createElement('div');
+            contextMenu.id = params.chartId + '_contextmenu';
+            contextMenu.style.cssText = `
+                position: fixed;
+                display: none;
+                background: #2a2e39;
+                border: 1px solid #434651;
+                border-radius: 4px;
+                box-shadow: 0 2px 8px rgba(0,0,0,0.3);
+                z-index: 10000;
+                padding: 4px 0;
+                min-width: 150px;
+            `;
 
-    return markers
+            const menuItems = [
+                { label: 'Set Start Date', action: 'start_date' },
+                { label: 'Set End Date', action: 'end_date' }
+            ];
+
+            menuItems.forEach(item => {
+                const menuItem = document.createElement('div');
+                menuItem.textContent = item.label;
+                menuItem.style.cssText = `
+                    padding: 8px 16px;
+                    cursor: pointer;
+                    color: #d1d4dc;
+                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+                    font-size: 14px;
+                `;
+                menuItem.addEventListener('mouseenter', () => {
+                    menuItem.style.background = '#434651';
+                });
+                menuItem.addEventListener('mouseleave', () => {
+                    menuItem.style.background = 'transparent';
+                });
+                menuItem.dataset.action = item.action;
+                contextMenu.appendChild(menuItem);
+            });
+
+            document.body.appendChild(contextMenu);
+
+            // Store context menu data
+            let contextMenuData = null;
+
+            // Handle right-click on chart
+            chartDiv.addEventListener('contextmenu', (e) => {
+                e.preventDefault();
+
+                // Get the position within the chart
+                const rect = chartDiv.getBoundingClientRect();
+                const x = e.clientX - rect.left;
+                const y = e.clientY - rect.top;
+
+                // Get the logical bar position (equal to the data index) at this x
+                const logical = chart.timeScale().coordinateToLogical(x);
+
+                if (logical !== null) {
+                    // Find the bar data
+                    const barIndex = Math.round(logical);
+                    if (barIndex >= 0 && barIndex < data.length) {
+                        // Store the bar position (fields are formatted in Python)
+                        contextMenuData = {
+                            index: barIndex
+                        };
+
+                        // Show context menu at cursor position
+                        contextMenu.style.display = 'block';
+                        contextMenu.style.left = e.clientX + 'px';
+                        contextMenu.style.top = e.clientY + 'px';
+                    }
+                }
+            });
+
+            // Handle context menu item clicks
+            contextMenu.addEventListener('click', (e) => {
+                const menuItem = e.target.closest('div[data-action]');
+                if (menuItem && contextMenuData) {
+                    const action = menuItem.dataset.action;
+
+                    // Send event to Python with action type
+                    emit(params.events.contextMenu, {
+                        ...contextMenuData,
+                        action: action
+                    });
 
+                    // Hide menu
+                    contextMenu.style.display = 'none';
+                    contextMenuData = null;
+                }
+            });
 
+            // Hide context menu when clicking elsewhere (removed with the chart via the signal)
+            const documentListeners = new AbortController();
+            document.addEventListener('click', () => {
+                contextMenu.style.display = 'none';
+            }, { signal: documentListeners.signal });
+
+            // Handle regular click events (left-click)
+            chart.subscribeClick(param => {
+                if (!param.point || param.logical === undefined) return;
+
+                // Logical index maps straight onto data (one point per bar)
+                const barIndex = param.logical;
+                if (barIndex < 0 || barIndex >= data.length) return;
+
+                // Get the clicked bar's price data
+                const price = param.seriesData.get(candlestickSeries);
+                if (!price) return;
+
+                // Get click Y coordinate and convert to price
+                const clickY = param.point.y;
+                const clickPrice = candlestickSeries.coordinateToPrice(clickY);
+
+                // Check if click is on any edge of any pattern rectangle
+                const patternOverlays = params.patternOverlays;
+
+                // First pass: Find all matching patterns at this click location
+                const matchingPatterns = [];
+
+                for (const pattern of patternOverlays) {
+                    // Get the price range for the pattern
+                    const { maxPrice, minPrice } = getPriceRange(pattern.start_idx, pattern.end_idx);
+                    const priceRange = maxPrice - minPrice;
+                    const padding = priceRange * 0.02;
+                    const tolerance = priceRange * 0.10; // 10% tolerance for clicking near edge
+
+                    const upperBound = maxPrice + padding;
+                    const lowerBound = minPrice - padding;
+
+                    // Check if click is within the horizontal range of the pattern
+                    const isWithinHorizontalRange = barIndex >= pattern.start_idx && barIndex < pattern.end_idx;
+
+                    // Check if click is on pattern boundary (edges or anywhere inside/near the rectangle)
+                    let isOnPattern = false;
+
+                    // Check if click is anywhere within or near the pattern rectangle bounds
+                    if (isWithinHorizontalRange && clickPrice >= lowerBound - tolerance && clickPrice <= upperBound + tolerance) {
+                        isOnPattern = true;
+                    }
+
+                    // Also check vertical edges (left and right)
+                    if ((barIndex === pattern.start_idx || barIndex === pattern.end_idx - 1) &&
+                        clickPrice >= lowerBound - tolerance && clickPrice <= upperBound + tolerance) {
+                        isOnPattern = true;
+                    }
+
+                    if (isOnPattern) {
+                        matchingPatterns.push(pattern);
+                    }
+                }
+
+                // If any patterns matched, prioritize the highlighted one (with green color)
+                if (matchingPatterns.length > 0) {
+                    // Find highlighted pattern (lime green with high opacity)
+                    let selectedPattern = matchingPatterns.find(p => p.color === 'rgba(50, 205, 50, 0.8)');
+
+                    // If no highlighted pattern, use the first match
+                    if (!selectedPattern) {
+                        selectedPattern = matchingPatterns[0];
+                    }
+
+                    console.log('Pattern clicked:', {
+                        barIndex: barIndex,
+                        clickPrice: clickPrice,
+                        pattern: selectedPattern.label,
+                        pattern_id: selectedPattern.pattern_id
+                    });
+
+                    // Click is on pattern
+                    emit(params.events.patternClick, {
+                        pattern_id: selectedPattern.pattern_id,
+                        label: selectedPattern.label,
+                        start_idx: selectedPattern.start_idx,
+                        end_idx: selectedPattern.end_idx
+                    });
+                    return;  // Don't process as bar click
+                }
+
+                // If not on pattern edge, handle as bar click
+                if (price) {
+                    // Send the bar position only (fields are formatted in Python)
+                    const eventData = {
+                        index: barIndex
+                    };
+
+                    // Send data to Python
+                    emit(params.events.click, eventData);
+                }
+            });
+
+            // Handle resize through one observer shared by all charts, one width update per frame
+            chartDiv.__tvChart = chart;
+            if (!window.__tvSharedResizeObserver) {
+                const pendingWidths = new Map();
+                let resizeFrame = null;
+                window.__tvSharedResizeObserver = new ResizeObserver(entries => {
+                    for (const entry of entries) {
+                        if (!entry.target.isConnected) {
+                            window.__tvSharedResizeObserver.unobserve(entry.target);
+                            pendingWidths.delete(entry.target);
+                            entry.target.__tvTeardown();
+                            continue;
+                        }
+                        pendingWidths.set(entry.target, entry.contentRect.width);
+                    }
+                    if (resizeFrame !== null) return;
+                    resizeFrame = requestAnimationFrame(() => {
+                        resizeFrame = null;
+                        pendingWidths.forEach((width, target) => target.__tvChart.applyOptions({ width }));
+                        pendingWidths.clear();
+                    });
+                });
+            }
+            window.__tvSharedResizeObserver.observe(chartDiv);
+
+            // Release the chart, its body-level menu and document listener once the container leaves the DOM
+            chartDiv.__tvTeardown = () => {
+                clearTimeout(rangeTimer);
+                documentListeners.abort();
+                contextMenu.remove();
+                liveApi = null;
+                chart.remove();
+                delete chartDiv.__tvChart;
+                delete chartDiv.__tvTeardown;
+            };
+
+            // Apply later updates from Python directly to this chart
+            liveApi = {
+                setOverlays: drawPatternOverlays,
+                setVisibleRange: range => chart.timeScale().setVisibleRange(range),
+                setHighlight: drawHighlight,
+            };
+
+            // Restore saved zoom/pan or fit content
+            const savedRange = params.savedRange;
+            if (savedRange && savedRange.from && savedRange.to) {
+                setTimeout(() => {
+                    chart.timeScale().setVisibleRange({
+                        from: savedRange.from,
+                        to: savedRange.to
+                    });
+                }, 100);
+            } else {
+                // Fit content to view on first load
+                setTimeout(() => chart.timeScale().fitContent(), 100);
+            }
+
+            // Save visible range when user zooms/pans (debounced to the end of the gesture)
+            let rangeTimer = null;
+            chart.timeScale().subscribeVisibleTimeRangeChange(() => {
+                clearTimeout(rangeTimer);
+                rangeTimer = setTimeout(() => {
+                    const visibleRange = chart.timeScale().getVisibleRange();
+                    if (visibleRange) {
+                        // Send to Python to save in app_state
+                        emit(params.events.range, {
+                            from: visibleRange.from,
+                            to: visibleRange.to
+                        });
+                    }
+                }, 150);
+            });
+        }
+    })(__PARAMS__);
+    '''
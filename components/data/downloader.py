@@ -4,13 +4,46 @@ HistData.com downloader utility for OHLCV data.
 Downloads monthly CSV files and converts them to Parquet format.
 """
 import os
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import BinaryIO, List, Dict, Optional, Tuple, Union
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+from utils.data_files import parse_data_filename
+
+
+# Parquet codec for saved OHLCV files (written once, read many times)
+PARQUET_COMPRESSION = 'zstd'
+PARQUET_COMPRESSION_LEVEL = 3
+
+# Retry policy for HistData requests (idempotent methods only)
+HTTP_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+
+# Only <form> subtrees are needed from the HistData download page
+_FORM_STRAINER = SoupStrainer('form')
+
+# Column types of the OHLCV frames built from ticks
+OHLCV_DTYPES = {
+    'open': 'float32',
+    'high': 'float32',
+    'low': 'float32',
+    'close': 'float32',
+    'volume': 'int32'
+}
+
+# path -> ((mtime_ns, size), (start_date, end_date, rows)) read from Parquet footers
+_parquet_info_cache = {}
 
 
 class HistDataDownloader:
@@ -82,14 +115,19 @@ class HistDataDownloader:
 
     BASE_URL = "http://www.histdata.com/download-free-forex-historical-data/"
 
-    def __init__(self, data_dir: str = "./data"):
+    def __init__(self, data_dir: str = "./data", max_workers: int = 8):
         """
         Initialize the downloader.
 
         Args:
             data_dir: Base directory for storing data
+            max_workers: Maximum number of months downloaded concurrently
         """
         self.data_dir = Path(data_dir)
+        self.max_workers = max_workers
+
+        # One keep-alive HTTP session per worker thread
+        self._local = threading.local()
         self.downloads_dir = self.data_dir / "downloads"
         self.parquet_dir = self.data_dir / "parquet"
 
@@ -97,6 +135,32 @@ class HistDataDownloader:
         self.downloads_dir.mkdir(parents=True, exist_ok=True)
         self.parquet_dir.mkdir(parents=True, exist_ok=True)
 
+    def _get_session(self) -> requests.Session:
+        """
+        Get the HTTP session for the current thread, creating it on first use.
+
+        Returns:
+            requests.Session with browser-like headers and retries on transient errors
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+
+            # Retry dropped connections and transient server errors with backoff
+            adapter = HTTPAdapter(max_retries=HTTP_RETRY)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+            # Set proper headers to avoid bot detection
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Referer': 'http://www.histdata.com/download-free-forex-historical-data/',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+            })
+            self._local.session = session
+        return session
+
     def get_download_url(self, symbol: str, timeframe: str, year: int, month: int) -> str:
         """
         Construct the download URL for a specific symbol, timeframe, and month.
@@ -158,22 +222,14 @@ class HistDataDownloader:
         page_url = self.get_download_url(symbol, timeframe, year, month)
 
         try:
-            session = requests.Session()
-
-            # Set proper headers to avoid bot detection
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Referer': 'http://www.histdata.com/download-free-forex-historical-data/',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            })
+            session = self._get_session()
 
             # Get the download page
             page_response = session.get(page_url, timeout=30)
             page_response.raise_for_status()
 
-            # Parse the page to find the download form
-            soup = BeautifulSoup(page_response.content, 'html.parser')
+            # Parse only the page's forms, with the C-based lxml parser
+            soup = BeautifulSoup(page_response.content, 'lxml', parse_only=_FORM_STRAINER)
 
             # Find the form with name="file_down" or id containing "download"
             form = soup.find('form', {'name': 'file_down'}) or soup.find('form', id=lambda x: x and 'download' in x.lower())
@@ -186,13 +242,12 @@ class HistDataDownloader:
             form_action = form.get('action', '')
             form_method = form.get('method', 'post').lower()
 
-            # Build the form data
-            form_data = {}
-            for input_tag in form.find_all('input'):
-                input_name = input_tag.get('name')
-                input_value = input_tag.get('value', '')
-                if input_name:
-                    form_data[input_name] = input_value
+            # Build the form data from the named inputs
+            form_data = {
+                input_tag['name']: input_tag.get('value', '')
+                for input_tag in form.find_all('input', attrs={'name': True})
+                if input_tag['name']
+            }
 
             # Submit the form to get the actual download
             if form_action.startswith('http'):
@@ -203,24 +258,28 @@ class HistDataDownloader:
                 download_url = urljoin(page_url, form_action)
 
             if form_method == 'post':
-                download_response = session.post(download_url, data=form_data, timeout=60)
+                download_response = session.post(download_url, data=form_data, timeout=60, stream=True)
             else:
-                download_response = session.get(download_url, params=form_data, timeout=60)
-
-            download_response.raise_for_status()
-
-            # Check if we got a ZIP file by examining the content
-            # ZIP files start with 'PK' (0x504B)
-            content = download_response.content
-            if not content.startswith(b'PK'):
-                content_type = download_response.headers.get('content-type', '')
-                print(f"Did not receive ZIP file for {filename}, got content-type: {content_type}")
-                print(f"Content starts with: {content[:50]}")
-                return None
+                download_response = session.get(download_url, params=form_data, timeout=60, stream=True)
+
+            with download_response:
+                download_response.raise_for_status()
+
+                # Check if we got a ZIP file by examining the first chunk
+                # ZIP files start with 'PK' (0x504B)
+                chunks = download_response.iter_content(chunk_size=65536)
+                first_chunk = next(chunks, b'')
+                if not first_chunk.startswith(b'PK'):
+                    content_type = download_response.headers.get('content-type', '')
+                    print(f"Did not receive ZIP file for {filename}, got content-type: {content_type}")
+                    print(f"Content starts with: {first_chunk[:50]}")
+                    return None
 
-            # Save the ZIP file
-            with open(zip_path, 'wb') as f:
-                f.write(content)
+                # Stream the ZIP file to disk
+                with open(zip_path, 'wb') as f:
+                    f.write(first_chunk)
+                    for chunk in chunks:
+                        f.write(chunk)
 
             # Verify it's a valid ZIP
             try:
@@ -234,6 +293,8 @@ class HistDataDownloader:
 
         except requests.RequestException as e:
             print(f"Failed to download {filename}: {e}")
+            # Drop any partially streamed file
+            zip_path.unlink(missing_ok=True)
             return None
 
     def extract_csv_from_zip(self, zip_path: Path) -> Optional[Path]:
@@ -263,12 +324,38 @@ class HistDataDownloader:
             print(f"Failed to extract {zip_path}: {e}")
             return None
 
-    def parse_csv_to_dataframe(self, csv_path: Path, timeframe: str) -> Optional[pd.DataFrame]:
+    def parse_zip_to_dataframe(self, zip_path: Path, timeframe: str) -> Optional[pd.DataFrame]:
+        """
+        Parse the CSV inside a downloaded ZIP without extracting it to disk.
+
+        Args:
+            zip_path: Path to ZIP file
+            timeframe: Timeframe for the data
+
+        Returns:
+            DataFrame with OHLCV data, or None if the archive has no readable CSV
+        """
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                # Get first CSV file in archive
+                csv_files = [f for f in zip_ref.namelist() if f.endswith('.csv')]
+                if not csv_files:
+                    return None
+
+                # Decompress straight into the CSV reader
+                with zip_ref.open(csv_files[0]) as csv_file:
+                    return self.parse_csv_to_dataframe(csv_file, timeframe)
+
+        except zipfile.BadZipFile as e:
+            print(f"Failed to extract {zip_path}: {e}")
+            return None
+
+    def parse_csv_to_dataframe(self, csv_path: Union[Path, BinaryIO], timeframe: str) -> Optional[pd.DataFrame]:
         """
         Parse CSV file to pandas DataFrame.
 
         Args:
-            csv_path: Path to CSV file
+            csv_path: Path to CSV file, or a readable binary file object
             timeframe: Timeframe for the data
 
         Returns:
@@ -277,11 +364,22 @@ class HistDataDownloader:
         try:
             # HistData.com tick data CSV format (no headers):
             # DateTime (YYYYMMDD HHMMSSmmm),Bid,Ask,Volume
-            df = pd.read_csv(csv_path, header=None, names=['datetime', 'bid', 'ask', 'volume'])
+            # Read with the multithreaded Arrow reader, keeping prices at float64
+            table = pv.read_csv(
+                csv_path,
+                read_options=pv.ReadOptions(column_names=['datetime', 'bid', 'ask', 'volume']),
+                convert_options=pv.ConvertOptions(column_types={
+                    'datetime': pa.string(),
+                    'bid': pa.float64(),
+                    'ask': pa.float64(),
+                    'volume': pa.int32(),
+                })
+            )
+            df = table.to_pandas()
 
             # Parse datetime - format is like "20241201 170048121"
             # This is YYYYMMDD HHMMSSmmm (with milliseconds)
-            df['datetime'] = pd.to_datetime(df['datetime'], format='%Y%m%d %H%M%S%f')
+            df['datetime'] = pd.to_datetime(df['datetime'], format='%Y%m%d %H%M%S%f', cache=True)
 
             # Convert tick data to OHLCV
             df = self._convert_tick_to_ohlcv(df, timeframe)
@@ -309,8 +407,11 @@ class HistDataDownloader:
         if 'datetime' in tick_df.columns:
             tick_df = tick_df.set_index('datetime')
 
-        # Use mid price between bid and ask
-        tick_df['price'] = (tick_df['bid'] + tick_df['ask']) / 2
+        # Use mid price between bid and ask (computed in place on one buffer)
+        price = np.add(tick_df['bid'].to_numpy(dtype=np.float64), tick_df['ask'].to_numpy(dtype=np.float64))
+        price *= 0.5
+        # float32 keeps ~7 significant digits, more than FX quotes carry, at half the width
+        price = pd.Series(price.astype(np.float32), index=tick_df.index, name='price')
 
         # Resample based on timeframe
         timeframe_map = {
@@ -321,36 +422,173 @@ class HistDataDownloader:
         }
         freq = timeframe_map.get(timeframe, '1min')
 
-        # Create OHLCV by resampling
-        ohlcv = tick_df['price'].resample(freq).ohlc()
-        ohlcv['volume'] = tick_df['price'].resample(freq).count()
+        # Create OHLCV in a single resampling pass
+        ohlcv = price.resample(freq).agg(['first', 'max', 'min', 'last', 'count'])
+        ohlcv.columns = ['open', 'high', 'low', 'close', 'volume']
 
-        return ohlcv
+        return ohlcv.astype(OHLCV_DTYPES)
 
-    def combine_and_save_parquet(self, symbol: str, timeframe: str, dataframes: List[pd.DataFrame]) -> Path:
+    def _fetch_month(self, symbol: str, timeframe: str, year: int, month: int) -> Tuple[Optional[pd.DataFrame], Optional[Path]]:
         """
-        Combine multiple DataFrames and save as Parquet.
+        Download, extract and parse a single month.
 
         Args:
             symbol: Trading pair symbol
             timeframe: Timeframe
+            year: Year
+            month: Month
+
+        Returns:
+            Tuple of (DataFrame or None, ZIP path or None)
+        """
+        zip_path = self.download_month(symbol, timeframe, year, month)
+        if not zip_path:
+            return None, None
+
+        df = self.parse_zip_to_dataframe(zip_path, timeframe)
+
+        return df, zip_path
+
+    def _fetch_months(
+        self,
+        symbol: str,
+        timeframe: str,
+        months: List[Tuple[int, int]],
+        progress_callback: Optional[callable] = None,
+        action: str = "Downloading"
+    ) -> List[Tuple[Optional[pd.DataFrame], Optional[Path]]]:
+        """
+        Fetch several months concurrently.
+
+        Progress is reported from the calling thread as months complete.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            months: List of (year, month) tuples
+            progress_callback: Optional callback function for progress updates
+            action: Verb used in progress messages
+
+        Returns:
+            List of (DataFrame or None, ZIP path or None), in the order of months
+        """
+        results = [(None, None)] * len(months)
+        if not months:
+            return results
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_month, symbol, timeframe, year, month): i
+                for i, (year, month) in enumerate(months)
+            }
+
+            for completed, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                results[i] = future.result()
+
+                if progress_callback:
+                    year, month = months[i]
+                    progress_callback(completed, len(months), f"{action} {symbol} {timeframe} {year}-{month:02d}")
+
+        return results
+
+    @staticmethod
+    def _months_between(start_date: datetime, end_date: datetime) -> List[Tuple[int, int]]:
+        """
+        List the (year, month) pairs from start_date to end_date inclusive.
+
+        Args:
+            start_date: First date to include
+            end_date: Last date to include
+
+        Returns:
+            List of (year, month) tuples
+        """
+        if start_date > end_date:
+            return []
+
+        # Count months from year 0 so the range is plain integer arithmetic
+        first = start_date.year * 12 + start_date.month - 1
+        last = end_date.year * 12 + end_date.month - 1
+        return [(index // 12, index % 12 + 1) for index in range(first, last + 1)]
+
+    @staticmethod
+    def _combine_dataframes(dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate DataFrames into one sorted frame without duplicate timestamps.
+
+        Args:
             dataframes: List of DataFrames to combine
 
         Returns:
-            Path to saved Parquet file
+            Combined DataFrame
         """
-        # Combine all dataframes
         combined_df = pd.concat(dataframes, ignore_index=False)
-        combined_df = combined_df.sort_index()
+
+        # Monthly frames arrive sorted and in order, so the global sort is usually skipped
+        if not combined_df.index.is_monotonic_increasing:
+            combined_df = combined_df.sort_index(kind='stable')
 
         # Remove duplicates
-        combined_df = combined_df[~combined_df.index.duplicated(keep='first')]
+        if not combined_df.index.is_unique:
+            combined_df = combined_df[~combined_df.index.duplicated(keep='first')]
+        return combined_df
+
+    @staticmethod
+    def _append_to_parquet(parquet_path: Path, new_df: pd.DataFrame) -> None:
+        """
+        Append rows that follow the existing data to a Parquet file.
+
+        Args:
+            parquet_path: Path to existing Parquet file
+            new_df: DataFrame whose index is entirely after the stored data
+        """
+        tmp_path = parquet_path.with_name(parquet_path.name + ".tmp")
+
+        # Copy existing row groups one at a time, then add the new rows, so memory stays at one row group
+        try:
+            with pq.ParquetFile(parquet_path) as existing:
+                schema = existing.schema_arrow
+                with pq.ParquetWriter(
+                    tmp_path,
+                    schema,
+                    compression=PARQUET_COMPRESSION,
+                    compression_level=PARQUET_COMPRESSION_LEVEL
+                ) as writer:
+                    for i in range(existing.num_row_groups):
+                        writer.write_table(existing.read_row_group(i))
+                    writer.write_table(pa.Table.from_pandas(new_df, schema=schema))
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Swap in the new file atomically so readers never see a partial write
+        os.replace(tmp_path, parquet_path)
+
+    def combine_and_save_parquet(self, symbol: str, timeframe: str, dataframes: List[pd.DataFrame]) -> Path:
+        """
+        Combine multiple DataFrames and save as Parquet.
+
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            dataframes: List of DataFrames to combine
+
+        Returns:
+            Path to saved Parquet file
+        """
+        combined_df = self._combine_dataframes(dataframes)
 
         # Save as Parquet
         parquet_filename = f"{symbol}_{timeframe}.parquet"
         parquet_path = self.parquet_dir / parquet_filename
 
-        combined_df.to_parquet(parquet_path, compression='gzip')
+        combined_df.to_parquet(
+            parquet_path,
+            engine='pyarrow',
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL
+        )
 
         return parquet_path
 
@@ -379,40 +617,15 @@ class HistDataDownloader:
 
             dataframes = []
             zip_files_to_cleanup = []  # Track ZIP files for cleanup after successful save
-            current_date = start_date
-
-            total_months = years * 12
-            processed_months = 0
-
-            while current_date <= end_date:
-                year = current_date.year
-                month = current_date.month
-
-                if progress_callback:
-                    progress_callback(processed_months, total_months, f"Downloading {symbol} {timeframe} {year}-{month:02d}")
-
-                # Download month
-                zip_path = self.download_month(symbol, timeframe, year, month)
-
-                if zip_path:
-                    # Extract CSV
-                    csv_path = self.extract_csv_from_zip(zip_path)
-
-                    if csv_path:
-                        # Parse to DataFrame
-                        df = self.parse_csv_to_dataframe(csv_path, timeframe)
-
-                        if df is not None:
-                            dataframes.append(df)
-                            zip_files_to_cleanup.append(zip_path)  # Mark for cleanup
 
-                        # Clean up CSV
-                        csv_path.unlink(missing_ok=True)
+            # Download all months concurrently
+            months = self._months_between(start_date, end_date)
+            results = self._fetch_months(symbol, timeframe, months, progress_callback, "Downloaded")
 
-                # Move to next month
-                current_date = current_date + timedelta(days=32)
-                current_date = current_date.replace(day=1)
-                processed_months += 1
+            for df, zip_path in results:
+                if df is not None:
+                    dataframes.append(df)
+                    zip_files_to_cleanup.append(zip_path)  # Mark for cleanup
 
             if not dataframes:
                 return False, f"No data downloaded for {symbol} {timeframe}"
@@ -437,44 +650,94 @@ class HistDataDownloader:
             List of dictionaries with info about each data file
         """
         data_files = []
+        cache_keys = []
 
         for parquet_file in self.parquet_dir.glob("*.parquet"):
             # Parse filename: SYMBOL_TIMEFRAME.parquet
-            parts = parquet_file.stem.split("_")
-            if len(parts) >= 2:
-                symbol = parts[0]
-                timeframe = parts[1]
+            symbol, timeframe = parse_data_filename(parquet_file.stem)
+            if timeframe is not None:
 
                 # Get file info
                 stat = parquet_file.stat()
                 size_mb = stat.st_size / (1024 * 1024)
                 modified = datetime.fromtimestamp(stat.st_mtime)
 
-                # Read parquet to get date range
-                try:
-                    df = pd.read_parquet(parquet_file)
-                    start_date = df.index.min()
-                    end_date = df.index.max()
-                    rows = len(df)
-                except Exception:
-                    start_date = None
-                    end_date = None
-                    rows = 0
-
                 data_files.append({
                     "symbol": symbol,
                     "timeframe": timeframe,
                     "filename": parquet_file.name,
                     "path": parquet_file,
                     "size_mb": round(size_mb, 2),
-                    "modified": modified,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "rows": rows
+                    "modified": modified
                 })
+                cache_keys.append((parquet_file, (stat.st_mtime_ns, stat.st_size)))
+
+        # Forget files of this directory that were removed since the last listing
+        listed = {path for path, _ in cache_keys}
+        for path in [path for path in _parquet_info_cache if path.parent == self.parquet_dir and path not in listed]:
+            del _parquet_info_cache[path]
+
+        # Read date ranges and row counts from the Parquet footers, opening new or changed files concurrently
+        missing = [
+            (path, version) for path, version in cache_keys
+            if _parquet_info_cache.get(path, (None,))[0] != version
+        ]
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                footers = executor.map(self._read_parquet_info_or_empty, [path for path, _ in missing])
+                for (path, version), footer in zip(missing, footers):
+                    _parquet_info_cache[path] = (version, footer)
+
+        for info, (path, _) in zip(data_files, cache_keys):
+            info["start_date"], info["end_date"], info["rows"] = _parquet_info_cache[path][1]
 
         return data_files
 
+    @classmethod
+    def _read_parquet_info_or_empty(cls, parquet_file: Path) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp], int]:
+        """Read Parquet footer info, treating unreadable files as empty."""
+        try:
+            return cls.read_parquet_info(parquet_file)
+        except Exception:
+            return None, None, 0
+
+    @staticmethod
+    def read_parquet_info(parquet_file: Path) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp], int]:
+        """
+        Read the index range and row count of a Parquet file without loading its data.
+
+        Args:
+            parquet_file: Path to Parquet file
+
+        Returns:
+            Tuple of (start_date, end_date, rows)
+        """
+        pf = pq.ParquetFile(parquet_file)
+        metadata = pf.metadata
+        rows = metadata.num_rows
+        if rows == 0:
+            return None, None, 0
+
+        # The DataFrame index is stored as a regular column named in the pandas metadata
+        pandas_metadata = pf.schema_arrow.pandas_metadata or {}
+        index_columns = pandas_metadata.get('index_columns', [])
+        if not index_columns or not isinstance(index_columns[0], str):
+            return None, None, rows
+        index_name = index_columns[0]
+        column = pf.schema_arrow.get_field_index(index_name)
+
+        stats = [metadata.row_group(i).column(column).statistics for i in range(metadata.num_row_groups)]
+        if all(s is not None and s.has_min_max for s in stats):
+            start_date = min(pd.Timestamp(s.min) for s in stats)
+            end_date = max(pd.Timestamp(s.max) for s in stats)
+        else:
+            # No statistics written; read just the index column
+            index = pf.read(columns=[index_name]).column(0).to_pandas()
+            start_date = index.min()
+            end_date = index.max()
+
+        return start_date, end_date, rows
+
     def update_data(
         self,
         symbol: str,
@@ -499,46 +762,33 @@ class HistDataDownloader:
             return False, f"No existing data found for {symbol} {timeframe}"
 
         try:
-            # Load existing data
-            existing_df = pd.read_parquet(parquet_path)
-            last_date = existing_df.index.max()
+            # Last stored bar comes from the footer; the existing data is never loaded into pandas
+            _, last_date, _ = self.read_parquet_info(parquet_path)
+            if last_date is None:
+                return False, f"No existing data found for {symbol} {timeframe}"
 
             # Download from last_date to now
             current_date = last_date + timedelta(days=1)
             end_date = datetime.now()
 
-            dataframes = [existing_df]
-
-            while current_date <= end_date:
-                year = current_date.year
-                month = current_date.month
-
-                if progress_callback:
-                    progress_callback(0, 1, f"Updating {symbol} {timeframe} {year}-{month:02d}")
-
-                # Download month
-                zip_path = self.download_month(symbol, timeframe, year, month)
-
-                if zip_path:
-                    csv_path = self.extract_csv_from_zip(zip_path)
-
-                    if csv_path:
-                        df = self.parse_csv_to_dataframe(csv_path, timeframe)
+            dataframes = []
 
-                        if df is not None:
-                            # Only keep data newer than what we have
-                            df = df[df.index > last_date]
-                            if not df.empty:
-                                dataframes.append(df)
+            # Download the missing months concurrently
+            months = self._months_between(current_date, end_date)
+            results = self._fetch_months(symbol, timeframe, months, progress_callback, "Updated")
 
-                        csv_path.unlink(missing_ok=True)
+            for df, _ in results:
+                if df is not None:
+                    # Only keep data newer than what we have
+                    df = df[df.index > last_date]
+                    if not df.empty:
+                        dataframes.append(df)
 
-                # Move to next month
-                current_date = current_date + timedelta(days=32)
-                current_date = current_date.replace(day=1)
+            if not dataframes:
+                return True, f"{symbol} {timeframe} is already up to date"
 
-            # Combine and save
-            updated_path = self.combine_and_save_parquet(symbol, timeframe, dataframes)
+            # New bars all follow last_date, so they can be appended without re-sorting the history
+            self._append_to_parquet(parquet_path, self._combine_dataframes(dataframes))
 
             return True, f"Successfully updated {symbol} {timeframe}"
 
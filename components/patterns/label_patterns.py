@@ -1,16 +1,53 @@
 """Pattern labeling tab - interactive chart with pattern annotation."""
 
+from functools import lru_cache
+
 from nicegui import ui
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 from pathlib import Path
+from typing import Optional
 
 from utils.app_init import initialize_pattern_library
+from utils.data_files import OHLCV_COLUMNS, list_parquet_files, parse_data_filename
+from components.data.downloader import HistDataDownloader
 from components.charts.tradingview_chart import create_tradingview_chart
 
 
+# Overlay fill for the pattern being navigated (lime green) and the other matches (dimmer)
+CURRENT_OVERLAY_COLOR = 'rgba(50, 205, 50, 0.8)'
+OVERLAY_COLOR = 'rgba(50, 205, 50, 0.5)'
+
+# History loaded into the chart: label -> days before the last bar (None = full file)
+HISTORY_WINDOWS = {
+    'All': None,
+    'Last year': 365,
+    'Last 6 months': 182,
+    'Last 3 months': 91,
+    'Last month': 31
+}
+
+
 def render_label_patterns_tab(app_state):
     """Render the pattern labeling interface."""
+    # Selection changes re-render this tab's content in place instead of reloading the page
+    @ui.refreshable
+    def content():
+        _render_label_patterns_content(app_state, content.refresh)
+
+    content()
+
+
+def _render_label_patterns_content(app_state, refresh):
+    """Build the labeling tab's controls, chart and statistics.
+
+    Args:
+        app_state: Application state dictionary
+        refresh: Callback that rebuilds this content from the current app_state
+    """
     initialize_pattern_library(app_state)
 
     # File selection
@@ -19,7 +56,7 @@ def render_label_patterns_tab(app_state):
         ui.notify("No data directory found. Please download data first.", type='warning')
         return
 
-    parquet_files = list(data_dir.glob("*.parquet"))
+    parquet_files = list_parquet_files(data_dir)
     if not parquet_files:
         ui.notify("No parquet files found. Please download data first.", type='warning')
         return
@@ -31,17 +68,17 @@ def render_label_patterns_tab(app_state):
     selected_file_idx = app_state.get('selected_file_idx', 0)
     selected_file = parquet_files[selected_file_idx]
 
-    # Load data
-    df = pd.read_parquet(selected_file)
-    df.index = pd.to_datetime(df.index)
+    history_window = app_state.get('label_history_window', 'All')
+    if history_window not in HISTORY_WINDOWS:
+        history_window = 'All'
 
-    # Filter out weekend bars (Saturday=5, Sunday=6)
-    df = df[~df.index.dayofweek.isin([5, 6])]
+    # Load data (cached until the file changes on disk)
+    mtime_ns = selected_file.stat().st_mtime_ns
+    df = _load_chart_data(str(selected_file), mtime_ns, HISTORY_WINDOWS[history_window])
 
     # Extract symbol and timeframe from filename
-    filename_parts = selected_file.stem.split('_')
-    symbol = filename_parts[0] if len(filename_parts) > 0 else "UNKNOWN"
-    timeframe = filename_parts[1] if len(filename_parts) > 1 else "UNKNOWN"
+    symbol, timeframe = parse_data_filename(selected_file.stem)
+    timeframe = timeframe or "UNKNOWN"
 
     # Create UI
     with ui.column().classes('w-full gap-4'):
@@ -59,11 +96,30 @@ def render_label_patterns_tab(app_state):
                 ).classes('flex-grow')
 
                 def on_file_change(e):
-                    app_state['selected_file_idx'] = file_names.index(e.value)
-                    ui.navigate.reload()
+                    new_idx = file_names.index(e.value)
+                    if new_idx == app_state['selected_file_idx']:
+                        return
+                    app_state['selected_file_idx'] = new_idx
+                    refresh()
 
                 file_select.on('update:model-value', on_file_change)
 
+                history_select = ui.select(
+                    label='History',
+                    options=list(HISTORY_WINDOWS),
+                    value=history_window
+                ).classes('w-48')
+
+                def on_history_change(e):
+                    if e.value == app_state.get('label_history_window', 'All'):
+                        return
+                    app_state['label_history_window'] = e.value
+                    # Row positions shift with the window, so drop the pending start bar
+                    app_state.pop('_pattern_start_index', None)
+                    refresh()
+
+                history_select.on_value_change(on_history_change)
+
         # Chart card
         with ui.card().classes('w-full'):
             ui.label(f'{symbol} - {timeframe}').classes('text-h6')
@@ -85,41 +141,10 @@ def render_label_patterns_tab(app_state):
                 app_state['selected_pattern_filter'] = None
 
             # Collect matching patterns ONCE (for both UI and chart)
-            matching_pattern_templates = []
-            if current_selection is not None:
-                for template in library.templates.values():
-                    template_label = template.label
-                    if isinstance(template_label, dict):
-                        template_label = template_label.get('label', str(template_label))
-                    elif not isinstance(template_label, str):
-                        template_label = str(template_label)
-
-                    if (template_label == current_selection and
-                        template.symbol == symbol and
-                        template.timeframe == timeframe):
-                        # Find the pattern's position in the current dataframe
-                        try:
-                            # Match by timestamp
-                            start_time = pd.Timestamp(template.start_time)
-                            end_time = pd.Timestamp(template.end_time)
-
-                            if start_time in df.index and end_time in df.index:
-                                start_pos = df.index.get_loc(start_time)
-                                end_pos = df.index.get_loc(end_time)
-
-                                matching_pattern_templates.append({
-                                    'template': template,
-                                    'start_idx': start_pos,
-                                    'end_idx': end_pos + 1,
-                                    'start_time': start_time,
-                                    'end_time': end_time
-                                })
-                        except (KeyError, ValueError):
-                            # Pattern not found in current data range, skip it
-                            pass
-
-                # Sort patterns by start index to maintain consistent ordering
-                matching_pattern_templates.sort(key=lambda x: x['start_idx'])
+            matching_pattern_templates = list(_cached_pattern_matches(
+                library, library.cache_state(), str(selected_file), mtime_ns, HISTORY_WINDOWS[history_window],
+                current_selection, symbol, timeframe
+            ))
 
             if all_labels:
                 with ui.element('div').style('border: 2px solid #4FC3F7; background-color: transparent; border-radius: 4px; padding: 8px; display: inline-block; margin-top: 8px;'):
@@ -144,7 +169,7 @@ def render_label_patterns_tab(app_state):
                             app_state['selected_pattern_filter'] = None if selected == '-- None --' else selected
                             # Reset current pattern index when changing filter
                             app_state['current_pattern_index'] = 0
-                            ui.navigate.reload()
+                            refresh()
 
                         pattern_select.on('update:model-value', on_pattern_select)
 
@@ -158,14 +183,27 @@ def render_label_patterns_tab(app_state):
                                 current_idx = max(0, min(current_idx, len(matching_pattern_templates) - 1))
                                 app_state['current_pattern_index'] = current_idx
 
+                                # Move to another pattern by updating the controls and chart in place
+                                def show_pattern(new_idx, scroll=True):
+                                    app_state['current_pattern_index'] = new_idx
+                                    app_state['_prev_pattern_index'] = new_idx
+                                    prev_btn.set_enabled(new_idx > 0)
+                                    next_btn.set_enabled(new_idx < len(matching_pattern_templates) - 1)
+                                    position_label.set_text(f'{new_idx + 1} / {len(matching_pattern_templates)}')
+                                    goto_input.set_value(str(new_idx + 1))
+
+                                    chart.set_pattern_overlays(_build_pattern_overlays(matching_pattern_templates, new_idx))
+                                    if scroll:
+                                        visible_range = _pattern_visible_range(df, matching_pattern_templates[new_idx])
+                                        app_state['_chart_visible_range'] = visible_range
+                                        chart.set_visible_range(visible_range)
+
                                 # Navigation buttons
                                 def go_to_previous():
-                                    app_state['current_pattern_index'] = max(0, current_idx - 1)
-                                    ui.navigate.reload()
+                                    show_pattern(max(0, app_state['current_pattern_index'] - 1))
 
                                 def go_to_next():
-                                    app_state['current_pattern_index'] = min(len(matching_pattern_templates) - 1, current_idx + 1)
-                                    ui.navigate.reload()
+                                    show_pattern(min(len(matching_pattern_templates) - 1, app_state['current_pattern_index'] + 1))
 
                                 # Visual separator
                                 ui.separator().props('vertical').classes('q-mx-md')
@@ -175,17 +213,15 @@ def render_label_patterns_tab(app_state):
                                     icon='chevron_left',
                                     on_click=go_to_previous
                                 ).props('round').props('size=sm')
-                                if current_idx == 0:
-                                    prev_btn.props('disable')
+                                prev_btn.set_enabled(current_idx > 0)
 
-                                ui.label(f'{current_idx + 1} / {len(matching_pattern_templates)}').classes('text-subtitle2 q-mx-sm')
+                                position_label = ui.label(f'{current_idx + 1} / {len(matching_pattern_templates)}').classes('text-subtitle2 q-mx-sm')
 
                                 next_btn = ui.button(
                                     icon='chevron_right',
                                     on_click=go_to_next
                                 ).props('round').props('size=sm')
-                                if current_idx >= len(matching_pattern_templates) - 1:
-                                    next_btn.props('disable')
+                                next_btn.set_enabled(current_idx < len(matching_pattern_templates) - 1)
 
                                 # Go to pattern index input
                                 ui.separator().props('vertical').classes('q-mx-md')
@@ -201,8 +237,7 @@ def render_label_patterns_tab(app_state):
                                     try:
                                         target_idx = int(goto_input.value) - 1  # Convert from 1-based to 0-based
                                         if 0 <= target_idx < len(matching_pattern_templates):
-                                            app_state['current_pattern_index'] = target_idx
-                                            ui.navigate.reload()
+                                            show_pattern(target_idx)
                                         else:
                                             ui.notify(f'Please enter a number between 1 and {len(matching_pattern_templates)}', type='warning')
                                     except (ValueError, TypeError):
@@ -221,7 +256,7 @@ def render_label_patterns_tab(app_state):
                     # Set start index
                     app_state['_pattern_start_index'] = index
                     ui.notify(f"Start date set to {time} (index: {index})", type='positive')
-                    ui.navigate.reload() #Reload to show the marker
+                    chart.set_highlight(index)  # Move the marker in place
 
                 elif action == 'end_date':
                     # Get start index
@@ -230,7 +265,6 @@ def render_label_patterns_tab(app_state):
 
                     if new_length > 0:
                         # Get existing pattern labels
-                        library = app_state['pattern_library']
                         existing_labels = library.get_all_labels()
 
                         # Show dialog to select or create pattern label
@@ -242,7 +276,6 @@ def render_label_patterns_tab(app_state):
 
                             # Dropdown for existing labels or custom input
                             selected_label = {'value': ''}
-                            custom_label = {'value': ''}
 
                             if existing_labels:
                                 # Add "Create New" option at the beginning
@@ -259,11 +292,9 @@ def render_label_patterns_tab(app_state):
                                     selected_label['value'] = value if value != '-- Create New --' else ''
                                     if value == '-- Create New --':
                                         custom_input.set_visibility(True)
-                                        custom_label['value'] = ''  # Clear custom label when switching to "Create New"
                                     else:
                                         custom_input.set_visibility(False)
                                         custom_input.set_value('')  # Clear the input field
-                                        custom_label['value'] = ''
 
                                 label_select.on('update:model-value', on_label_select)
                             else:
@@ -278,11 +309,6 @@ def render_label_patterns_tab(app_state):
                             # Show custom input by default (for "Create New" or no existing labels)
                             custom_input.set_visibility(True)
 
-                            def on_custom_input(e):
-                                custom_label['value'] = e.args
-
-                            custom_input.on('update:model-value', on_custom_input)
-
                             ui.separator().classes('q-my-md')
 
                             with ui.row().classes('w-full justify-end gap-2'):
@@ -290,27 +316,25 @@ def render_label_patterns_tab(app_state):
 
                                 def save_and_close():
                                     # Determine which label to use
-                                    final_label = custom_label['value'] if custom_label['value'] else selected_label['value']
+                                    # The input's value is already synced by NiceGUI, so read it here instead of
+                                    # handling every keystroke
+                                    custom_label = custom_input.value or ''
+                                    final_label = custom_label if custom_label else selected_label['value']
 
                                     if not final_label or final_label == '-- Create New --':
                                         ui.notify('Please enter or select a pattern label', type='warning')
                                         return
 
                                     # Save the pattern
-                                    pattern_data = df.iloc[current_start:index + 1].copy()
+                                    pattern_data = df.iloc[current_start:index + 1]  # add_pattern copies what it keeps
                                     _save_pattern(app_state, pattern_data, final_label, symbol, timeframe)
 
-                                    # Clear the start index to remove markers
-                                    if '_pattern_start_index' in app_state:
-                                        app_state.pop('_pattern_start_index', None)
-
-                                    # Force pattern library to reload from disk on next page load
-                                    if 'pattern_library' in app_state:
-                                        del app_state['pattern_library']
+                                    # Clear the start index and reset the marker to the first bar
+                                    app_state.pop('_pattern_start_index', None)
+                                    chart.set_highlight(0)
 
-                                    # Close dialog first, then reload to reset the UI
                                     label_dialog.close()
-                                    ui.navigate.reload()
+                                    refresh_patterns()
 
                                 ui.button('Save Pattern', on_click=save_and_close, color='primary')
 
@@ -336,50 +360,13 @@ def render_label_patterns_tab(app_state):
                 app_state['_prev_pattern_index'] = current_pattern_idx
 
                 # Add all patterns to overlays, highlighting the current one
-                for idx, pattern_template in enumerate(matching_pattern_templates):
-                    # Extract label as string (handle dict labels)
-                    template_label = pattern_template['template'].label
-                    if isinstance(template_label, dict):
-                        template_label = template_label.get('label', str(template_label))
-                    elif not isinstance(template_label, str):
-                        template_label = str(template_label)
-
-                    # Create overlay dict
-                    overlay = {
-                        'start_idx': pattern_template['start_idx'],
-                        'end_idx': pattern_template['end_idx'],
-                        'label': template_label,
-                        'pattern_id': pattern_template['template'].id
-                    }
-
-                    # Highlight current pattern with different color and opacity
-                    if idx == current_pattern_idx:
-                        overlay['color'] = 'rgba(50, 205, 50, 0.8)'  # Lime green for current pattern
-
-                        # Only update visible range if pattern changed (user navigated)
-                        if pattern_changed:
-                            # Set visible range to center on this pattern
-                            pattern_length = pattern_template['end_idx'] - pattern_template['start_idx']
-                            context_bars = max(pattern_length * 2, 50)  # Show 2x pattern length or min 50 bars
-
-                            # Calculate visible range indices
-                            center_idx = (pattern_template['start_idx'] + pattern_template['end_idx']) // 2
-                            range_start_idx = max(0, center_idx - context_bars // 2)
-                            range_end_idx = min(len(df) - 1, center_idx + context_bars // 2)
-
-                            # Convert to timestamps (Unix timestamp in seconds)
-                            range_start_time = int(df.index[range_start_idx].timestamp())
-                            range_end_time = int(df.index[range_end_idx].timestamp())
-
-                            # Update the saved range to center on current pattern
-                            app_state['_chart_visible_range'] = {
-                                'from': range_start_time,
-                                'to': range_end_time
-                            }
-                    else:
-                        overlay['color'] = 'rgba(50, 205, 50, 0.5)'  # Dimmer lime green for other patterns
+                pattern_overlays = _build_pattern_overlays(matching_pattern_templates, current_pattern_idx)
 
-                    pattern_overlays.append(overlay)
+                # Only update visible range if pattern changed (user navigated)
+                if pattern_changed:
+                    app_state['_chart_visible_range'] = _pattern_visible_range(
+                        df, matching_pattern_templates[current_pattern_idx]
+                    )
 
             # Define handler for pattern rectangle clicks
             def handle_pattern_click(pattern_data):
@@ -389,7 +376,6 @@ def render_label_patterns_tab(app_state):
                     return
 
                 # Get the pattern from library
-                library = app_state['pattern_library']
                 template = library.templates.get(pattern_id)
                 if not template:
                     ui.notify("Pattern not found", type='warning')
@@ -398,12 +384,7 @@ def render_label_patterns_tab(app_state):
                 # Get all available labels for dropdown
                 all_labels = library.get_all_labels()
 
-                # Extract template label as string
                 template_label = template.label
-                if isinstance(template_label, dict):
-                    template_label = template_label.get('label', str(template_label))
-                elif not isinstance(template_label, str):
-                    template_label = str(template_label)
 
                 # Show dialog to edit or delete pattern
                 with ui.dialog() as pattern_dialog, ui.card():
@@ -437,12 +418,8 @@ def render_label_patterns_tab(app_state):
                             library.save()
                             ui.notify(f"Pattern '{template_label}' deleted", type='positive')
 
-                            # Force pattern library to reload from disk on next page load
-                            if 'pattern_library' in app_state:
-                                del app_state['pattern_library']
-
                             pattern_dialog.close()
-                            ui.navigate.reload()
+                            refresh_patterns()
 
                         ui.button('Delete', on_click=delete_pattern, color='negative')
 
@@ -454,22 +431,19 @@ def render_label_patterns_tab(app_state):
                                 new_label = selected_label['value']
                                 if new_label != template_label:
                                     # Update the label
-                                    template.label = new_label
+                                    library.relabel_template(template.id, new_label)
                                     library.save()
                                     ui.notify(f"Pattern label updated to '{new_label}'", type='positive')
 
-                                    # Force pattern library to reload from disk on next page load
-                                    if 'pattern_library' in app_state:
-                                        del app_state['pattern_library']
-
                                 pattern_dialog.close()
-                                ui.navigate.reload()
+                                if new_label != template_label:
+                                    refresh_patterns()
 
                             ui.button('Save', on_click=save_changes, color='primary')
 
                 pattern_dialog.open()
 
-            create_tradingview_chart(
+            chart = create_tradingview_chart(
                 df=df,
                 start_idx=pattern_start if pattern_start is not None else 0,
                 end_idx=None,  # No end until user sets it
@@ -481,16 +455,189 @@ def render_label_patterns_tab(app_state):
                 on_pattern_click=handle_pattern_click  # Handle pattern rectangle clicks
             )
 
+            def refresh_patterns():
+                """Redraw overlays and counts after a library edit, reloading only when controls change shape."""
+                matched = _cached_pattern_matches(
+                    library, library.cache_state(), str(selected_file), mtime_ns, HISTORY_WINDOWS[history_window],
+                    current_selection, symbol, timeframe
+                )
+                labels = library.get_all_labels()
+                if bool(matched) != bool(matching_pattern_templates) or bool(labels) != bool(all_labels):
+                    refresh()
+                    return
+
+                if labels != all_labels:
+                    all_labels[:] = labels
+                    pattern_select.set_options(['-- None --'] + labels)
+
+                matching_pattern_templates[:] = matched
+                if matched:
+                    show_pattern(min(app_state.get('current_pattern_index', 0), len(matched) - 1), scroll=False)
+
+                template_count = library.get_template_count()
+                total_label.set_text(f'Total Patterns: {template_count}')
+                labels_label.set_text(f"Labels: {', '.join(labels)}")
+                labels_label.set_visibility(template_count > 0)
+
         # Pattern library statistics
         with ui.card().classes('w-full'):
-            library = app_state['pattern_library']
             with ui.column():
-                ui.label(f'Total Patterns: {library.get_template_count()}').classes('text-subtitle2')
-                if library.get_template_count() > 0:
-                    labels_str = ', '.join(library.get_all_labels())
-                    ui.label(f'Labels: {labels_str}').classes('text-caption text-grey-7')
+                template_count = library.get_template_count()
+                total_label = ui.label(f'Total Patterns: {template_count}').classes('text-subtitle2')
+                labels_label = ui.label(f"Labels: {', '.join(all_labels)}").classes('text-caption text-grey-7')
+                labels_label.set_visibility(template_count > 0)
+
+
+
+
+def _match_pattern_templates(library, df: pd.DataFrame, selected_label: Optional[str], symbol: str, timeframe: str) -> list:
+    """Find library patterns with the selected label on this symbol/timeframe and their row spans in df."""
+    if selected_label is None:
+        return []
+
+    templates = library.get_templates(selected_label, symbol, timeframe)
+    if not templates or len(df) == 0:
+        return []
+
+    # Locate every pattern's start and end bar with one binary search each over the index
+    start_times, end_times = library.get_template_times(selected_label, symbol, timeframe)
+    start_positions = df.index.searchsorted(start_times)
+    end_positions = df.index.searchsorted(end_times)
+
+    # Keep patterns whose start and end timestamps are both bars in the current dataframe
+    last_row = len(df) - 1
+    found = (
+        (df.index[np.minimum(start_positions, last_row)] == start_times) &
+        (df.index[np.minimum(end_positions, last_row)] == end_times)
+    )
+
+    matching_pattern_templates = [
+        {
+            'template': template,
+            'start_idx': int(start_pos),
+            'end_idx': int(end_pos) + 1,
+            'start_time': start_time,
+            'end_time': end_time
+        }
+        for template, start_pos, end_pos, start_time, end_time, is_found in zip(
+            templates, start_positions, end_positions, start_times, end_times, found
+        )
+        if is_found
+    ]
+
+    # Sort patterns by start index to maintain consistent ordering
+    matching_pattern_templates.sort(key=lambda x: x['start_idx'])
+    return matching_pattern_templates
+
+
+@lru_cache(maxsize=16)
+def _cached_pattern_matches(library, library_state: tuple, path: str, mtime_ns: int, window_days: Optional[int],
+                            selected_label: Optional[str], symbol: str, timeframe: str) -> tuple:
+    """Memoized _match_pattern_templates for a loaded chart file.
+
+    Args:
+        library: PatternLibrary to match against
+        library_state: library.cache_state(), part of the cache key so any library edit invalidates it
+        path: Parquet file path
+        mtime_ns: File modification time, part of the cache key so edits invalidate it
+        window_days: History window passed to _load_chart_data
+        selected_label: Pattern label filter (None matches nothing)
+        symbol: Symbol the file holds
+        timeframe: Timeframe the file holds
+
+    Returns:
+        Tuple of matched pattern dicts (callers copy it into a list before mutating)
+    """
+    df = _load_chart_data(path, mtime_ns, window_days)
+    return tuple(_match_pattern_templates(library, df, selected_label, symbol, timeframe))
+
+
+def _build_pattern_overlays(matching_pattern_templates: list, current_idx: int) -> list:
+    """Build chart overlay dicts for matched patterns, highlighting the current one."""
+    return [
+        {
+            'start_idx': pattern_template['start_idx'],
+            'end_idx': pattern_template['end_idx'],
+            'label': pattern_template['template'].label,
+            'pattern_id': pattern_template['template'].id,
+            'color': CURRENT_OVERLAY_COLOR if idx == current_idx else OVERLAY_COLOR
+        }
+        for idx, pattern_template in enumerate(matching_pattern_templates)
+    ]
+
+
+def _pattern_visible_range(df: pd.DataFrame, pattern_template: dict) -> dict:
+    """Visible chart range (Unix seconds) centered on a matched pattern."""
+    pattern_length = pattern_template['end_idx'] - pattern_template['start_idx']
+    context_bars = max(pattern_length * 2, 50)  # Show 2x pattern length or min 50 bars
+
+    # Calculate visible range indices
+    center_idx = (pattern_template['start_idx'] + pattern_template['end_idx']) // 2
+    range_start_idx = max(0, center_idx - context_bars // 2)
+    range_end_idx = min(len(df) - 1, center_idx + context_bars // 2)
+
+    # Convert to timestamps (Unix timestamp in seconds)
+    return {
+        'from': int(df.index[range_start_idx].timestamp()),
+        'to': int(df.index[range_end_idx].timestamp())
+    }
 
 
+@lru_cache(maxsize=4)
+def _load_chart_data(path: str, mtime_ns: int, window_days: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load a parquet file for labeling, without weekend bars.
+
+    The result is shared between reloads, so callers must not modify it.
+
+    Args:
+        path: Parquet file path
+        mtime_ns: File modification time, part of the cache key so edits invalidate it
+        window_days: Only load bars from this many days before the last bar (None = all)
+
+    Returns:
+        OHLCV DataFrame with a DatetimeIndex
+    """
+    dataset = ds.dataset(path, format='parquet')
+
+    # Push the window down to Parquet so row groups before it are never read
+    row_filter = None
+    if window_days is not None:
+        _, end_date, _ = HistDataDownloader.read_parquet_info(Path(path))
+        if end_date is not None:
+            row_filter = ds.field('datetime') >= end_date - pd.Timedelta(days=window_days)
+
+    # Project to the OHLCV columns the chart and saved patterns use, plus the datetime index
+    columns = [column for column in OHLCV_COLUMNS + ['datetime'] if column in dataset.schema.names]
+    schema = pa.schema([dataset.schema.field(column) for column in columns], metadata=dataset.schema.metadata)
+
+    # Stream record batches, dropping weekend bars (Saturday=5, Sunday=6) before they reach pandas
+    batches = []
+    for batch in dataset.to_batches(columns=columns, filter=row_filter):
+        weekday = pc.day_of_week(batch.column('datetime'))
+        batches.append(batch.filter(pc.less(weekday, 5)))
+
+    table = pa.Table.from_batches(batches, schema=schema)
+    del batches
+
+    # Files written before bars were stored as float32 hold float64 prices; display needs no more than float32
+    price_columns = {'open', 'high', 'low', 'close'}
+    narrowed = pa.schema(
+        [
+            field.with_type(pa.float32()) if field.name in price_columns and field.type == pa.float64() else field
+            for field in schema
+        ],
+        metadata=schema.metadata
+    )
+    if narrowed != schema:
+        table = table.cast(narrowed)
+
+    # One block per column avoids the consolidation copy, and self_destruct frees each Arrow
+    # column as it is converted so the data is not held twice
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+    df.index = pd.to_datetime(df.index, cache=True)
+    return df
 
 
 def _save_pattern(app_state, pattern_data: pd.DataFrame, label: str, symbol: str, timeframe: str):
@@ -1,10 +1,14 @@
 """Pattern scanning tab - real-time pattern detection."""
 
+from functools import lru_cache
+
 from nicegui import ui
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
 
 from utils.app_init import initialize_scanner_components
+from utils.data_files import OHLCV_COLUMNS, list_parquet_files
 
 
 def render_scan_patterns_tab(app_state):
@@ -28,7 +32,7 @@ def render_scan_patterns_tab(app_state):
         ui.notify("No data directory found.", type='negative')
         return
 
-    parquet_files = list(data_dir.glob("*.parquet"))
+    parquet_files = list_parquet_files(data_dir)
     if not parquet_files:
         ui.notify("No parquet files found.", type='negative')
         return
@@ -60,9 +64,11 @@ def render_scan_patterns_tab(app_state):
                 ).classes('w-48')
 
                 def update_window_size(e):
-                    app_state['scanner_window_size'] = int(e.value)
+                    if e.value is not None:  # Empty while the field is being retyped
+                        app_state['scanner_window_size'] = int(e.value)
 
-                window_size_input.on('update:model-value', update_window_size)
+                # Server-side change hook: no extra client event per keystroke
+                window_size_input.on_value_change(update_window_size)
 
             with ui.row().classes('w-full items-center gap-4'):
                 ui.label('Min Confidence:').classes('text-subtitle2')
@@ -76,16 +82,15 @@ def render_scan_patterns_tab(app_state):
                 def update_min_confidence(e):
                     app_state['scanner_min_confidence'] = e.value
 
-                min_confidence_slider.on('update:model-value', update_min_confidence)
+                min_confidence_slider.on_value_change(update_min_confidence)
 
             def scan_for_patterns():
                 selected_file = parquet_files[app_state.get('scanner_file_index', 0)]
                 window_size = app_state.get('scanner_window_size', 50)
                 min_confidence = app_state.get('scanner_min_confidence', 0.7)
 
-                # Load data
-                df = pd.read_parquet(selected_file)
-                df.index = pd.to_datetime(df.index)
+                # Load data (cached until the file changes on disk)
+                df = _load_scan_data(str(selected_file), selected_file.stat().st_mtime_ns)
 
                 # Run backtest
                 backtester = app_state['backtester']
@@ -157,3 +162,28 @@ def render_scan_patterns_tab(app_state):
                                     ui.label(f"End Price: {window_data['close'].iloc[-1]:.5f}")
                                     change_color = 'positive' if price_change > 0 else 'negative'
                                     ui.label(f"Change: {price_change:.2%}").classes(f'text-{change_color}')
+
+
+@lru_cache(maxsize=4)
+def _load_scan_data(path: str, mtime_ns: int) -> pd.DataFrame:
+    """
+    Load the OHLCV columns of a parquet file for scanning.
+
+    The result is shared between scans, so callers must not modify it.
+
+    Args:
+        path: Parquet file path
+        mtime_ns: File modification time, part of the cache key so edits invalidate it
+
+    Returns:
+        OHLCV DataFrame with a DatetimeIndex
+    """
+    # Project to the price/volume columns; the pandas index is restored from the file metadata
+    schema_names = pq.read_schema(path).names
+    columns = [column for column in OHLCV_COLUMNS if column in schema_names]
+    table = pq.read_table(path, columns=columns, use_pandas_metadata=True)
+    # Convert without consolidating blocks, releasing Arrow columns as they are converted
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+    df.index = pd.to_datetime(df.index, cache=True)
+    return df
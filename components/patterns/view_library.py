@@ -13,10 +13,13 @@ def render_view_library_tab(app_state):
 
     library = app_state['pattern_library']
 
-    if library.get_template_count() == 0:
+    template_count = library.get_template_count()
+    if template_count == 0:
         ui.label("No patterns in library yet. Use the 'Label Patterns' tab to add patterns.").classes('text-caption')
         return
 
+    unique_labels = library.get_all_labels()
+
     with ui.column().classes('w-full gap-4'):
         # Statistics card
         with ui.card().classes('w-full'):
@@ -25,10 +28,9 @@ def render_view_library_tab(app_state):
             with ui.row().classes('w-full gap-4'):
                 with ui.card().classes('bg-blue-grey-9'):
                     ui.label('Total Patterns').classes('text-caption text-grey-7')
-                    ui.label(str(library.get_template_count())).classes('text-h5')
+                    ui.label(str(template_count)).classes('text-h5')
 
                 with ui.card().classes('bg-blue-grey-9'):
-                    unique_labels = library.get_all_labels()
                     ui.label('Unique Labels').classes('text-caption text-grey-7')
                     ui.label(str(len(unique_labels))).classes('text-h5')
 
@@ -72,7 +74,6 @@ def render_view_library_tab(app_state):
         with ui.card().classes('w-full'):
             ui.label('Pattern Browser').classes('text-h6 q-mb-md')
 
-            unique_labels = library.get_all_labels()
             label_options = ['All'] + unique_labels
 
             selected_label = ui.select(
@@ -122,34 +123,46 @@ def _display_templates(app_state, library, selected_label):
         with ui.expansion(
             f"{label_str} - {template.symbol} {template.timeframe} ({template.bars_count} bars) - Quality: {template.quality_score:.2f}",
             icon='pattern'
-        ).classes('w-full'):
-            with ui.row().classes('w-full gap-4'):
-                with ui.column():
-                    ui.label('Pattern Info').classes('text-subtitle2')
-                    ui.label(f"ID: {template.id[:16]}...")
-                    ui.label(f"Label: {label_str}")
-                    ui.label(f"Bars: {template.bars_count}")
-                    ui.label(f"Quality: {template.quality_score:.3f}")
-
-                with ui.column():
-                    ui.label('Metadata').classes('text-subtitle2')
-                    ui.label(f"Symbol: {template.symbol}")
-                    ui.label(f"Timeframe: {template.timeframe}")
-                    ui.label(f"Period: {template.start_time.strftime('%Y-%m-%d')} to {template.end_time.strftime('%Y-%m-%d')}")
-                    if template.is_augmented:
-                        ui.label(f"Augmented: {template.augmentation_type}")
-
-            # Chart
-            fig = _create_pattern_chart(template)
-            ui.plotly(fig).classes('w-full')
-
-            def delete_pattern(t=template):
-                del library.templates[t.id]
-                library.save()
-                ui.notify('Pattern deleted!', type='positive')
-                ui.navigate.reload()
-
-            ui.button(f'Delete Pattern', on_click=delete_pattern, color='negative', icon='delete')
+        ).classes('w-full') as expansion:
+            # Details and chart are built the first time the expansion is opened
+            body = ui.column().classes('w-full')
+
+        def render_body(e, t=template, label_str=label_str, container=body):
+            if e.value and not container.default_slot.children:
+                with container:
+                    _display_template_details(library, t, label_str)
+
+        expansion.on_value_change(render_body)
+
+
+def _display_template_details(library, template, label_str):
+    """Display one template's info, chart and delete button inside its expansion."""
+    with ui.row().classes('w-full gap-4'):
+        with ui.column():
+            ui.label('Pattern Info').classes('text-subtitle2')
+            ui.label(f"ID: {template.id[:16]}...")
+            ui.label(f"Label: {label_str}")
+            ui.label(f"Bars: {template.bars_count}")
+            ui.label(f"Quality: {template.quality_score:.3f}")
+
+        with ui.column():
+            ui.label('Metadata').classes('text-subtitle2')
+            ui.label(f"Symbol: {template.symbol}")
+            ui.label(f"Timeframe: {template.timeframe}")
+            ui.label(f"Period: {template.start_time.strftime('%Y-%m-%d')} to {template.end_time.strftime('%Y-%m-%d')}")
+            if template.is_augmented:
+                ui.label(f"Augmented: {template.augmentation_type}")
+
+    # Chart
+    ui.plotly(_create_pattern_chart(template)).classes('w-full')
+
+    def delete_pattern():
+        library.delete_template(template.id)
+        library.save()
+        ui.notify('Pattern deleted!', type='positive')
+        ui.navigate.reload()
+
+    ui.button(f'Delete Pattern', on_click=delete_pattern, color='negative', icon='delete')
 
 
 def _create_pattern_chart(template):
@@ -160,18 +173,18 @@ def _create_pattern_chart(template):
         row_heights=[0.6, 0.4]
     )
 
-    # Convert index to strings to avoid Timestamp serialization issues
-    raw_data_plot = template.raw_data.copy()
-    raw_data_plot.index = raw_data_plot.index.astype(str)
+    # Format the index in one vectorized call to avoid Timestamp serialization issues
+    raw_data = template.raw_data
+    x_labels = raw_data.index.strftime('%Y-%m-%d %H:%M:%S').to_numpy()
 
     # Raw candlestick
     fig.add_trace(
         go.Candlestick(
-            x=raw_data_plot.index,
-            open=raw_data_plot['open'],
-            high=raw_data_plot['high'],
-            low=raw_data_plot['low'],
-            close=raw_data_plot['close'],
+            x=x_labels,
+            open=raw_data['open'].to_numpy(),
+            high=raw_data['high'].to_numpy(),
+            low=raw_data['low'].to_numpy(),
+            close=raw_data['close'].to_numpy(),
             name='OHLC'
         ),
         row=1, col=1
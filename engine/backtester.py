@@ -281,16 +281,18 @@ class Backtester:
         preprocessor = Preprocessor()
         detections = []
 
-        for i in range(0, len(ohlc_data) - window_size + 1, step):
-            window_data = ohlc_data.iloc[i:i + window_size]
+        # Slice windows from the close array; a DataFrame slice is only built for matches
+        closes = ohlc_data['close'].to_numpy()
 
+        for i in range(0, len(ohlc_data) - window_size + 1, step):
             # Normalize window
-            query = preprocessor.normalize_pattern(window_data)
+            query = preprocessor.normalize_pattern(closes[i:i + window_size])
 
             # Find matches
             matches = self.matcher.find_matches(query, min_confidence=min_confidence)
 
             if matches:
+                window_data = ohlc_data.iloc[i:i + window_size]
                 for match in matches:
                     detections.append({
                         'start_index': i,
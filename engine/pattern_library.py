@@ -2,8 +2,9 @@
 
 import pickle
 import uuid
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
@@ -12,6 +13,10 @@ from .preprocessor import Preprocessor
 from .dtw_core import DTWCalculator
 
 
+# OHLCV columns stored with each template
+PERSISTED_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
 class PatternLibrary:
     """Manages collection of pattern templates."""
 
@@ -31,6 +36,17 @@ class PatternLibrary:
         self.templates: Dict[str, PatternTemplate] = {}
         self.index_dirty = False
 
+        # Bumped on every change made through the library's methods
+        self.version = 0
+
+        # (label, symbol, timeframe) -> templates, label -> templates and sorted labels,
+        # rebuilt lazily when the library changes
+        self._key_index: Dict[Tuple[str, str, str], List[PatternTemplate]] = {}
+        self._label_index: Dict[str, List[PatternTemplate]] = {}
+        self._labels: Tuple[str, ...] = ()
+        self._time_index: Dict[Tuple[str, str, str], Tuple[pd.DatetimeIndex, pd.DatetimeIndex]] = {}
+        self._index_state = None
+
     def add_pattern(
         self,
         label: str,
@@ -48,6 +64,13 @@ class PatternLibrary:
         Returns:
             Created PatternTemplate
         """
+        # Copy each stored column exactly once so the template never pins the caller's
+        # (possibly large) frame; a list selection may itself be a view of its blocks
+        ohlc_data = pd.DataFrame(
+            {c: ohlc_data[c].copy() for c in ohlc_data.columns if c in PERSISTED_COLUMNS},
+            copy=False
+        )
+
         # Preprocess
         normalized = self.preprocessor.normalize_pattern(ohlc_data)
 
@@ -57,7 +80,7 @@ class PatternLibrary:
         # Create template
         template = PatternTemplate(
             id=str(uuid.uuid4()),
-            label=label,
+            label=label_to_str(label),
             raw_data=ohlc_data,
             normalized=normalized,
             quality_score=quality,
@@ -70,6 +93,7 @@ class PatternLibrary:
 
         self.templates[template.id] = template
         self.index_dirty = True
+        self.version += 1
         return template
 
     def augment_library(self, mirror_patterns: bool = True):
@@ -88,6 +112,7 @@ class PatternLibrary:
                 self.templates[mirrored.id] = mirrored
 
         self.index_dirty = True
+        self.version += 1
 
     def _create_mirror(self, template: PatternTemplate) -> PatternTemplate:
         """Create mirrored version of pattern (flip vertically)."""
@@ -108,7 +133,7 @@ class PatternLibrary:
         mirrored = PatternTemplate(
             id=str(uuid.uuid4()),
             label=new_label,
-            raw_data=template.raw_data.copy(),
+            raw_data=template.raw_data,  # Shared with the parent; raw data is never modified
             normalized=mirrored_normalized,
             symbol=template.symbol,
             timeframe=template.timeframe,
@@ -150,21 +175,96 @@ class PatternLibrary:
         Returns:
             List of matching templates
         """
-        return [t for t in self.templates.values() if t.label == label]
+        self._refresh_lookup_indexes()
+        return list(self._label_index.get(label, ()))
+
+    def get_templates(self, label: str, symbol: str, timeframe: str) -> List[PatternTemplate]:
+        """
+        Retrieve templates with a label on one symbol and timeframe.
+
+        Args:
+            label: Pattern label
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+
+        Returns:
+            List of matching templates (do not modify)
+        """
+        self._refresh_lookup_indexes()
+        return self._key_index.get((label, symbol, timeframe), [])
+
+    def get_template_times(self, label: str, symbol: str, timeframe: str) -> Tuple[pd.DatetimeIndex, pd.DatetimeIndex]:
+        """
+        Start and end times of get_templates(label, symbol, timeframe), converted once.
+
+        Args:
+            label: Pattern label
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+
+        Returns:
+            Tuple of (start times, end times) aligned with get_templates(); unparseable times are NaT
+        """
+        templates = self.get_templates(label, symbol, timeframe)
+        key = (label, symbol, timeframe)
+        if key not in self._time_index:
+            self._time_index[key] = (
+                pd.to_datetime([t.start_time for t in templates], errors='coerce'),
+                pd.to_datetime([t.end_time for t in templates], errors='coerce')
+            )
+        return self._time_index[key]
+
+    def cache_state(self) -> Tuple[int, int, int]:
+        """
+        Return a key that changes whenever the template set may have changed.
+
+        Besides the version bumped by the library's own methods, the key tracks the
+        identity and size of the templates dict, since the backtester swaps it directly.
+        """
+        return (self.version, id(self.templates), len(self.templates))
+
+    def _refresh_lookup_indexes(self):
+        """Rebuild the label lookups if the library changed since they were built."""
+        state = self.cache_state()
+        if self._index_state == state:
+            return
+
+        # Labels are normalized to strings on every insert path, so the key is read as-is
+        key_of = attrgetter('label', 'symbol', 'timeframe')
+        key_index = {}
+        label_index = {}
+        for t in self.templates.values():
+            key = key_of(t)
+            key_index.setdefault(key, []).append(t)
+            label_index.setdefault(key[0], []).append(t)
+        self._key_index = key_index
+        self._label_index = label_index
+        self._labels = tuple(sorted(label_index))
+        self._time_index = {}
+        self._index_state = state
+
+    def relabel_template(self, template_id: str, label: str) -> bool:
+        """
+        Change the label of a template.
+
+        Args:
+            template_id: ID of the template to relabel
+            label: New pattern label
+
+        Returns:
+            True if template was relabeled, False if not found
+        """
+        template = self.templates.get(template_id)
+        if template is None:
+            return False
+        template.label = label_to_str(label)
+        self.version += 1
+        return True
 
     def get_all_labels(self) -> List[str]:
         """Get list of all unique labels."""
-        labels = []
-        for t in self.templates.values():
-            # Handle case where label might be corrupted/wrong type
-            if isinstance(t.label, str):
-                labels.append(t.label)
-            elif isinstance(t.label, dict):
-                # Try to extract label from dict if it's stored that way
-                labels.append(t.label.get('label', str(t.label)))
-            else:
-                labels.append(str(t.label))
-        return sorted(set(labels))
+        self._refresh_lookup_indexes()
+        return list(self._labels)
 
     def get_template_count(self) -> int:
         """Get total number of templates."""
@@ -183,6 +283,7 @@ class PatternLibrary:
         if template_id in self.templates:
             del self.templates[template_id]
             self.index_dirty = True
+            self.version += 1
             return True
         return False
 
@@ -198,9 +299,14 @@ class PatternLibrary:
         if library_file.exists():
             with open(library_file, "rb") as f:
                 self.templates = pickle.load(f)
+
+            # Older libraries may hold non-string labels; normalize them once here
+            for t in self.templates.values():
+                t.label = label_to_str(t.label)
             self.index_dirty = True
         else:
             self.templates = {}
+        self.version += 1
 
     def _compute_quality_score(self, ohlc_data: pd.DataFrame) -> float:
         """
@@ -226,3 +332,12 @@ class PatternLibrary:
         scores.append(completeness)
 
         return np.mean(scores)
+
+
+def label_to_str(label) -> str:
+    """Return a pattern label as a string (labels were sometimes stored as dicts)."""
+    if isinstance(label, str):
+        return label
+    if isinstance(label, dict):
+        return label.get('label', str(label))
+    return str(label)
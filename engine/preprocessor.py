@@ -2,7 +2,7 @@
 
 import pandas as pd
 import numpy as np
-from typing import Optional
+from typing import Optional, Union
 
 
 class Preprocessor:
@@ -17,19 +17,22 @@ class Preprocessor:
         """
         self.normalization = normalization
 
-    def normalize_pattern(self, ohlc_data: pd.DataFrame, use_derivative: bool = True) -> np.ndarray:
+    def normalize_pattern(self, ohlc_data: Union[pd.DataFrame, np.ndarray], use_derivative: bool = True) -> np.ndarray:
         """
         Normalize pattern for DTW matching.
 
         Args:
-            ohlc_data: DataFrame with OHLCV data
+            ohlc_data: DataFrame with OHLCV data, or an array of close prices
             use_derivative: Whether to use derivative DTW (DDTW)
 
         Returns:
             Normalized feature vector
         """
         # Step 1: Extract close prices
-        prices = ohlc_data['close'].values
+        if isinstance(ohlc_data, np.ndarray):
+            prices = ohlc_data
+        else:
+            prices = ohlc_data['close'].values
 
         # Step 2: Compute first-order derivative (for DDTW)
         if use_derivative:
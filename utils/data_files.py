@@ -0,0 +1,53 @@
+"""Shared helpers for locating downloaded data files."""
+
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Price/volume columns the tabs load from a data file (anything else is skipped)
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# SYMBOL_TIMEFRAME[_...] file stems
+_DATA_FILENAME_RE = re.compile(r'([^_]*)(?:_([^_]*))?')
+
+# Directory path -> (directory mtime_ns, sorted parquet paths)
+_parquet_listing_cache = {}
+
+
+def list_parquet_files(data_dir: Path) -> List[Path]:
+    """List the parquet files in a directory, re-scanning only when the directory changes.
+
+    Adding, removing or renaming a file updates the directory's mtime, which
+    invalidates the cached listing.
+
+    Args:
+        data_dir: Directory holding SYMBOL_TIMEFRAME.parquet files
+
+    Returns:
+        Parquet file paths sorted by name
+    """
+    mtime_ns = data_dir.stat().st_mtime_ns
+    cached = _parquet_listing_cache.get(str(data_dir))
+    if cached is None or cached[0] != mtime_ns:
+        # scandir yields the names without a per-entry stat
+        with os.scandir(data_dir) as entries:
+            files = sorted(data_dir / entry.name for entry in entries if entry.name.endswith('.parquet'))
+        cached = (mtime_ns, tuple(files))
+        _parquet_listing_cache[str(data_dir)] = cached
+    return list(cached[1])
+
+
+@lru_cache(maxsize=256)
+def parse_data_filename(stem: str) -> Tuple[str, Optional[str]]:
+    """Split a data file stem into its symbol and timeframe.
+
+    Args:
+        stem: File name without extension, e.g. EURUSD_M1
+
+    Returns:
+        Tuple of (symbol, timeframe); timeframe is None when the stem has no underscore
+    """
+    symbol, timeframe = _DATA_FILENAME_RE.match(stem).groups()
+    return symbol, timeframe